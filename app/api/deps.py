@@ -1,14 +1,17 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
+from app.core.security import decode_token_cached
 from app.db.session import get_db
 from app.models.user import User
 
 security = HTTPBearer()
 
+# Built once at import; callers pass {"email": ...} as parameters.
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -22,8 +25,9 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    # Access tokens are presented on every request, so reuse verified payloads
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         email: str | None = payload.get("sub")
         token_type: str | None = payload.get("type")
 
@@ -33,7 +37,7 @@ async def get_current_user(
         raise credentials_exception
 
     # Get user from database
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(USER_BY_EMAIL, {"email": email})
     user = result.scalar_one_or_none()
 
     if user is None:
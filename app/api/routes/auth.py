@@ -1,8 +1,10 @@
 import base64
 import hashlib
+import hmac
 import secrets
 import urllib.parse
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from urllib.parse import urlparse
 from uuid import UUID
 
@@ -15,24 +17,26 @@ from fastapi import (
     Response,
     status,
 )
-from fastapi.responses import RedirectResponse
-from jose import jwt
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import DateTime, LargeBinary, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user
+from app.api.deps import USER_BY_EMAIL, get_current_active_user
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    dummy_password_hash,
+    encode_token,
     generate_token_hash,
     generate_verification_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
 )
-from app.db.session import get_db
+from app.db.session import get_db, insert_for
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 from app.schemas.auth import (
@@ -44,31 +48,56 @@ from app.schemas.auth import (
     UserResponse,
     VerifyEmailRequest,
 )
+from app.services import token_revocation
 from app.services.email import send_verification_email
+from app.services.http_client import get_http_client
 
 GOOGLE_AUTH_BASE = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_ENDPOINT = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_ENDPOINT = "https://openidconnect.googleapis.com/v1/userinfo"
 
+REFRESH_TTL = timedelta(days=settings.refresh_token_expire_days)
+VERIFY_TTL = timedelta(hours=settings.email_verification_token_expire_hours)
+EXCHANGE_CODE_TTL = timedelta(minutes=5)
+
+# Fixed MessageResponse bodies, encoded once at import.
+_VERIFICATION_SENT_BODY = ORJSONResponse(
+    {"message": "If the account exists, a verification email was sent."}
+).body
+_REGISTERED_BODY = ORJSONResponse({"message": "User registered successfully"}).body
+_EMAIL_VERIFIED_BODY = ORJSONResponse({"message": "Email verified successfully"}).body
+_LOGGED_OUT_BODY = ORJSONResponse({"message": "Logged out successfully"}).body
+
 router = APIRouter()
 
 
-def _build_google_auth_url(redirect_to: str, state: str, code_challenge: str) -> str:
-    scopes = settings.google_oauth_scopes or "openid email profile"
+@cache
+def _google_auth_url_prefix(client_id: str, redirect_uri: str, scopes: str) -> str:
+    # Only state and code_challenge vary per request; encode the rest once.
     params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": settings.google_redirect_uri,
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
         "response_type": "code",
         "scope": scopes,
-        "state": state,
-        "code_challenge": code_challenge,
         "code_challenge_method": "S256",
         "prompt": "select_account",
     }
-    # Forward redirect target via state cookie, not via query param.
     return f"{GOOGLE_AUTH_BASE}?{urllib.parse.urlencode(params)}"
 
 
+def _build_google_auth_url(redirect_to: str, state: str, code_challenge: str) -> str:
+    prefix = _google_auth_url_prefix(
+        settings.google_client_id,
+        settings.google_redirect_uri,
+        settings.google_oauth_scopes or "openid email profile",
+    )
+    # Forward redirect target via state cookie, not via query param.
+    return (
+        f"{prefix}&state={urllib.parse.quote_plus(state)}"
+        f"&code_challenge={urllib.parse.quote_plus(code_challenge)}"
+    )
+
+
 def _safe_redirect_path(value: str | None) -> str:
     if not value or not value.startswith("/"):
         return "/"
@@ -83,7 +112,8 @@ def _generate_code_verifier() -> str:
 
 def _generate_code_challenge(code_verifier: str) -> str:
     digest = hashlib.sha256(code_verifier.encode("utf-8")).digest()
-    return base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
+    # A 32-byte digest is always 43 base64 chars plus one "=" of padding.
+    return base64.urlsafe_b64encode(digest)[:43].decode("ascii")
 
 
 def _clear_oauth_cookie(response: Response, name: str) -> None:
@@ -91,8 +121,6 @@ def _clear_oauth_cookie(response: Response, name: str) -> None:
 
 
 async def _exchange_google_code(code: str, code_verifier: str) -> dict:
-    import httpx
-
     data = {
         "client_id": settings.google_client_id,
         "client_secret": settings.google_client_secret,
@@ -101,31 +129,25 @@ async def _exchange_google_code(code: str, code_verifier: str) -> dict:
         "redirect_uri": settings.google_redirect_uri,
         "grant_type": "authorization_code",
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(GOOGLE_TOKEN_ENDPOINT, data=data)
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().post(GOOGLE_TOKEN_ENDPOINT, data=data)
+    response.raise_for_status()
+    return response.json()
 
 
 async def _fetch_google_userinfo(access_token: str) -> dict:
-    import httpx
-
     headers = {"Authorization": f"Bearer {access_token}"}
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(GOOGLE_USERINFO_ENDPOINT, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().get(GOOGLE_USERINFO_ENDPOINT, headers=headers)
+    response.raise_for_status()
+    return response.json()
 
 
 def _create_exchange_code(user_id: str) -> str:
     payload = {
         "sub": user_id,
         "type": "google_exchange",
-        "exp": datetime.now(UTC) + timedelta(minutes=5),
+        "exp": datetime.now(UTC) + EXCHANGE_CODE_TTL,
     }
-    return jwt.encode(
-        payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
+    return encode_token(payload)
 
 
 def _decode_exchange_code(token: str) -> str:
@@ -199,7 +221,8 @@ async def google_callback(
         )
         return response
 
-    if state != cookie_state:
+    # Constant-time compare; bytes so non-ASCII input can't raise TypeError.
+    if not hmac.compare_digest(state.encode("utf-8"), cookie_state.encode("utf-8")):
         response.headers["Location"] = (
             f"{settings.frontend_url}/login?error=google_oauth"
         )
@@ -213,39 +236,58 @@ async def google_callback(
 
         userinfo = await _fetch_google_userinfo(access_token)
         google_sub = userinfo.get("sub")
-        email = userinfo.get("email")
+        email = (userinfo.get("email") or "").lower()
 
         if not google_sub or not email:
             raise HTTPException(status_code=400, detail="Google userinfo incomplete")
 
-        result = await db.execute(select(User).where(User.google_sub == google_sub))
-        user = result.scalar_one_or_none()
-
-        if not user:
-            result = await db.execute(select(User).where(User.email == email))
-            user = result.scalar_one_or_none()
-            if user:
-                user.google_sub = google_sub
-                user.is_verified = True
-                user.email_verification_token_hash = None
-                user.email_verification_expires_at = None
-                await db.commit()
-            else:
-                random_password = secrets.token_urlsafe(32)
-                user = User(
-                    email=email,
-                    hashed_password=get_password_hash(random_password),
-                    first_name=userinfo.get("given_name"),
-                    last_name=userinfo.get("family_name"),
-                    is_active=True,
-                    is_verified=True,
-                    google_sub=google_sub,
-                )
-                db.add(user)
+        # Returning Google users are matched by sub; otherwise link the account
+        # to an existing email, and only hash a placeholder password when a new
+        # user has to be created. The insert still upserts on email in case a
+        # concurrent signup claimed the address in between.
+        result = await db.execute(select(User.id).where(User.google_sub == google_sub))
+        user_id = result.scalar_one_or_none()
+
+        link_values = {
+            "google_sub": google_sub,
+            "is_verified": True,
+            "email_verification_token_hash": None,
+            "email_verification_expires_at": None,
+            "updated_at": func.now(),
+        }
+
+        if user_id is None:
+            result = await db.execute(
+                update(User)
+                .where(User.email == email)
+                .values(**link_values)
+                .returning(User.id)
+            )
+            user_id = result.scalar_one_or_none()
+            if user_id is not None:
                 await db.commit()
-                await db.refresh(user)
 
-        exchange_code = _create_exchange_code(str(user.id))
+        if user_id is None:
+            random_password = secrets.token_urlsafe(32)
+            insert_stmt = insert_for(db, User).values(
+                email=email,
+                hashed_password=await get_password_hash_async(random_password),
+                first_name=userinfo.get("given_name"),
+                last_name=userinfo.get("family_name"),
+                is_active=True,
+                is_verified=True,
+                google_sub=google_sub,
+            )
+            result = await db.execute(
+                insert_stmt.on_conflict_do_update(
+                    index_elements=[User.email],
+                    set_=link_values,
+                ).returning(User.id)
+            )
+            user_id = result.scalar_one()
+            await db.commit()
+
+        exchange_code = _create_exchange_code(str(user_id))
         redirect_url = (
             f"{settings.frontend_url}/auth/google/callback?code="
             f"{urllib.parse.quote(exchange_code)}&redirect={urllib.parse.quote(redirect_to)}"
@@ -286,7 +328,7 @@ async def google_complete(
     access_token = create_access_token(data={"sub": user.email})
     refresh_token = create_refresh_token(data={"sub": user.email})
 
-    expires_at = datetime.now(UTC) + timedelta(days=7)
+    expires_at = datetime.now(UTC) + REFRESH_TTL
     refresh_token_record = RefreshToken(
         user_id=user.id,
         token_hash=generate_token_hash(refresh_token),
@@ -295,33 +337,41 @@ async def google_complete(
     db.add(refresh_token_record)
     await db.commit()
 
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=_cookie_secure(),
-        samesite=_cookie_samesite(),
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
-        domain=_cookie_domain(),
-        path="/",
-    )
+    response.set_cookie("refresh_token", refresh_token, **_refresh_cookie_params())
 
     return TokenResponse(access_token=access_token)
 
 
+@cache
+def _cookie_policy(
+    frontend_url: str, cookie_domain: str | None, cookie_secure: bool
+) -> tuple[str | None, bool]:
+    # Parsed once per settings combination rather than on every auth request.
+    parsed = urlparse(frontend_url)
+    domain = cookie_domain
+    if not domain:
+        host = parsed.hostname
+        if host and host not in {"localhost", "127.0.0.1"}:
+            domain = f".{host.lstrip('.')}"
+    return domain, cookie_secure or parsed.scheme == "https"
+
+
 def _cookie_domain() -> str | None:
-    if settings.cookie_domain:
-        return settings.cookie_domain
-    host = urlparse(settings.frontend_url).hostname
-    if not host or host in {"localhost", "127.0.0.1"}:
-        return None
-    return f".{host.lstrip('.')}"
+    return _cookie_policy(
+        settings.frontend_url, settings.cookie_domain, settings.cookie_secure
+    )[0]
 
 
 def _cookie_secure() -> bool:
-    if settings.cookie_secure:
-        return True
-    return urlparse(settings.frontend_url).scheme == "https"
+    return _cookie_policy(
+        settings.frontend_url, settings.cookie_domain, settings.cookie_secure
+    )[1]
+
+
+def _message_response(body: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
 
 
 def _cookie_samesite() -> str:
@@ -331,6 +381,17 @@ def _cookie_samesite() -> str:
     return "lax"
 
 
+def _refresh_cookie_params() -> dict:
+    return {
+        "httponly": True,
+        "secure": _cookie_secure(),
+        "samesite": _cookie_samesite(),
+        "max_age": int(REFRESH_TTL.total_seconds()),
+        "domain": _cookie_domain(),
+        "path": "/",
+    }
+
+
 @router.post(
     "/auth/register",
     response_model=MessageResponse,
@@ -342,55 +403,53 @@ async def register(
     db: AsyncSession = Depends(get_db),
 ):
     """Register a new user."""
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
-        if not existing_user.is_verified:
-            verification_token = generate_verification_token()
-            existing_user.email_verification_token_hash = generate_token_hash(
-                verification_token
-            )
-            existing_user.email_verification_expires_at = datetime.now(UTC) + timedelta(
-                hours=settings.email_verification_token_expire_hours
-            )
-            await db.commit()
-            background_tasks.add_task(
-                send_verification_email, existing_user.email, verification_token
-            )
-            return MessageResponse(
-                message="If the account exists, a verification email was sent."
-            )
+    # Insert first; ON CONFLICT makes concurrent registrations race-safe and
+    # the happy path a single round trip.
+    hashed_password = await get_password_hash_async(user_data.password)
+    verification_token = generate_verification_token()
+    result = await db.execute(
+        insert_for(db, User)
+        .values(
+            email=user_data.email,
+            hashed_password=hashed_password,
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            email_verification_token_hash=generate_token_hash(verification_token),
+            email_verification_expires_at=datetime.now(UTC) + VERIFY_TTL,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id)
+    )
 
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
+    if result.scalar_one_or_none() is not None:
+        await db.commit()
+        background_tasks.add_task(
+            send_verification_email, user_data.email, verification_token
         )
+        return _message_response(_REGISTERED_BODY, status_code=status.HTTP_201_CREATED)
 
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    verification_token = generate_verification_token()
-    new_user = User(
-        email=user_data.email,
-        hashed_password=hashed_password,
-        first_name=user_data.first_name,
-        last_name=user_data.last_name,
-        email_verification_token_hash=generate_token_hash(verification_token),
-        email_verification_expires_at=datetime.now(UTC)
-        + timedelta(hours=settings.email_verification_token_expire_hours),
-    )
+    # User already exists
+    result = await db.execute(USER_BY_EMAIL, {"email": user_data.email})
+    existing_user = result.scalar_one()
 
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    if not existing_user.is_verified:
+        existing_user.email_verification_token_hash = generate_token_hash(
+            verification_token
+        )
+        existing_user.email_verification_expires_at = datetime.now(UTC) + VERIFY_TTL
+        await db.commit()
+        background_tasks.add_task(
+            send_verification_email, existing_user.email, verification_token
+        )
+        return _message_response(
+            _VERIFICATION_SENT_BODY, status_code=status.HTTP_201_CREATED
+        )
 
-    background_tasks.add_task(
-        send_verification_email, new_user.email, verification_token
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered",
     )
 
-    return MessageResponse(message="User registered successfully")
-
 
 @router.post("/auth/login", response_model=TokenResponse)
 async def login(
@@ -400,11 +459,16 @@ async def login(
 ):
     """Login and receive access token."""
     # Get user by email
-    result = await db.execute(select(User).where(User.email == user_credentials.email))
+    result = await db.execute(USER_BY_EMAIL, {"email": user_credentials.email})
     user = result.scalar_one_or_none()
 
-    # Verify credentials
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    # Verify credentials; unknown emails pay the same hashing cost so response
+    # timing does not reveal which accounts exist.
+    hashed_password = user.hashed_password if user else await dummy_password_hash()
+    password_ok = await verify_password_async(
+        user_credentials.password, hashed_password
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -422,6 +486,11 @@ async def login(
             detail="Email not verified",
         )
 
+    # Lazily migrate legacy bcrypt hashes (and stale Argon2 parameters); the
+    # new hash is committed together with the refresh token below.
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash_async(user_credentials.password)
+
     # Create access token
     access_token = create_access_token(data={"sub": user.email})
 
@@ -429,7 +498,7 @@ async def login(
     refresh_token = create_refresh_token(data={"sub": user.email})
 
     # Store refresh token in database
-    expires_at = datetime.now(UTC) + timedelta(days=7)
+    expires_at = datetime.now(UTC) + REFRESH_TTL
 
     refresh_token_record = RefreshToken(
         user_id=user.id,
@@ -440,20 +509,65 @@ async def login(
     await db.commit()
 
     # Set refresh token as httpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=_cookie_secure(),
-        samesite=_cookie_samesite(),
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
-        domain=_cookie_domain(),
-        path="/",
-    )
+    response.set_cookie("refresh_token", refresh_token, **_refresh_cookie_params())
 
     return TokenResponse(access_token=access_token)
 
 
+async def _rotate_refresh_token(
+    db: AsyncSession,
+    *,
+    email: str,
+    old_token_hash: bytes,
+    new_token_hash: bytes,
+    expires_at: datetime,
+) -> UUID | None:
+    """Revoke an active refresh token and store its replacement.
+
+    Returns the owner's id, or None if the old token is not active for the
+    user. On PostgreSQL both writes go out as one statement (an UPDATE in a
+    CTE feeding the INSERT); other dialects issue them separately.
+    """
+    revoke = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id
+            == select(User.id).where(User.email == email).scalar_subquery(),
+            RefreshToken.token_hash == old_token_hash,
+            RefreshToken.revoked == False,  # noqa: E712
+            RefreshToken.expires_at > datetime.now(UTC),
+        )
+        .values(revoked=True)
+        .returning(RefreshToken.user_id)
+    )
+
+    if db.get_bind().dialect.name == "postgresql":
+        revoked = revoke.cte("revoked")
+        result = await db.execute(
+            insert(RefreshToken)
+            .from_select(
+                ["user_id", "token_hash", "expires_at"],
+                select(
+                    revoked.c.user_id,
+                    literal(new_token_hash, LargeBinary),
+                    literal(expires_at, DateTime(timezone=True)),
+                ),
+            )
+            .returning(RefreshToken.user_id)
+        )
+        return result.scalar_one_or_none()
+
+    result = await db.execute(revoke)
+    user_id = result.scalar_one_or_none()
+    if user_id is not None:
+        db.add(
+            RefreshToken(
+                user_id=user_id, token_hash=new_token_hash, expires_at=expires_at
+            )
+        )
+    return user_id
+
+
 @router.post("/auth/refresh", response_model=TokenResponse)
 async def refresh_token(
     request: Request,
@@ -473,7 +587,7 @@ async def refresh_token(
         raise credentials_exception
 
     try:
-        # Decode refresh token
+        # Decode refresh token; single-use, so not worth a decode-cache slot
         payload = decode_token(refresh_token)
         email: str | None = payload.get("sub")
         token_type: str | None = payload.get("type")
@@ -483,58 +597,36 @@ async def refresh_token(
     except ValueError:
         raise credentials_exception
 
-    # Get user
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise credentials_exception
-
-    # Verify refresh token exists in database and is not revoked
+    # Reject tokens already known to be revoked without a database round trip
     refresh_token_hash = generate_token_hash(refresh_token)
-    token_result = await db.execute(
-        select(RefreshToken).where(
-            RefreshToken.user_id == user.id,
-            RefreshToken.revoked == False,  # noqa: E712
-            RefreshToken.expires_at > datetime.now(UTC),
-            (RefreshToken.token_hash == refresh_token_hash)
-            | (RefreshToken.token_hash == refresh_token),  # legacy raw tokens
-        )
-    )
-    stored_token = token_result.scalar_one_or_none()
-
-    if not stored_token:
+    if await token_revocation.is_revoked(refresh_token_hash):
         raise credentials_exception
 
-    # Revoke old refresh token
-    stored_token.revoked = True
-
     # Create new access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data={"sub": email})
 
     # Create new refresh token (token rotation)
-    new_refresh_token = create_refresh_token(data={"sub": user.email})
-    expires_at = datetime.now(UTC) + timedelta(days=7)
-
-    new_refresh_token_record = RefreshToken(
-        user_id=user.id,
-        token_hash=generate_token_hash(new_refresh_token),
-        expires_at=expires_at,
+    new_refresh_token = create_refresh_token(data={"sub": email})
+
+    # Rotation is atomic: the old token is revoked only if it is still active
+    # and belongs to the user, so each refresh token can be used once.
+    user_id = await _rotate_refresh_token(
+        db,
+        email=email,
+        old_token_hash=refresh_token_hash,
+        new_token_hash=generate_token_hash(new_refresh_token),
+        expires_at=datetime.now(UTC) + REFRESH_TTL,
     )
-    db.add(new_refresh_token_record)
+    if user_id is None:
+        raise credentials_exception
+
     await db.commit()
+    await token_revocation.mark_revoked(
+        [(refresh_token_hash, datetime.fromtimestamp(payload["exp"], UTC))]
+    )
 
     # Set new refresh token as httpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=new_refresh_token,
-        httponly=True,
-        secure=_cookie_secure(),
-        samesite=_cookie_samesite(),
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
-        domain=_cookie_domain(),
-        path="/",
-    )
+    response.set_cookie("refresh_token", new_refresh_token, **_refresh_cookie_params())
 
     return TokenResponse(access_token=access_token)
 
@@ -547,29 +639,29 @@ async def verify_email(
     """Verify a user's email using a one-time token."""
     token_hash = generate_token_hash(payload.token)
     result = await db.execute(
-        select(User).where(User.email_verification_token_hash == token_hash)
-    )
-    user = result.scalar_one_or_none()
-
-    if not user or not user.email_verification_expires_at:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired verification token",
+        update(User)
+        .where(
+            User.email_verification_token_hash == token_hash,
+            User.email_verification_expires_at > datetime.now(UTC),
+            User.is_verified == False,  # noqa: E712
         )
+        .values(
+            is_verified=True,
+            email_verification_token_hash=None,
+            email_verification_expires_at=None,
+        )
+        .returning(User.id)
+    )
+    verified_user_id = result.scalar_one_or_none()
+    await db.commit()
 
-    if user.email_verification_expires_at < datetime.now(UTC):
+    if verified_user_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired verification token",
         )
 
-    if not user.is_verified:
-        user.is_verified = True
-        user.email_verification_token_hash = None
-        user.email_verification_expires_at = None
-        await db.commit()
-
-    return MessageResponse(message="Email verified successfully")
+    return _message_response(_EMAIL_VERIFIED_BODY)
 
 
 @router.post("/auth/resend-verification", response_model=MessageResponse)
@@ -579,50 +671,45 @@ async def resend_verification(
     db: AsyncSession = Depends(get_db),
 ):
     """Resend email verification link if user exists and isn't verified."""
-    result = await db.execute(select(User).where(User.email == payload.email))
+    result = await db.execute(USER_BY_EMAIL, {"email": payload.email})
     user = result.scalar_one_or_none()
 
     if user and not user.is_verified:
         verification_token = generate_verification_token()
         user.email_verification_token_hash = generate_token_hash(verification_token)
-        user.email_verification_expires_at = datetime.now(UTC) + timedelta(
-            hours=settings.email_verification_token_expire_hours
-        )
+        user.email_verification_expires_at = datetime.now(UTC) + VERIFY_TTL
         await db.commit()
         background_tasks.add_task(
             send_verification_email, user.email, verification_token
         )
 
-    return MessageResponse(
-        message="If the account exists, a verification email was sent."
-    )
+    return _message_response(_VERIFICATION_SENT_BODY)
 
 
 @router.post("/auth/logout", response_model=MessageResponse)
 async def logout(
-    response: Response,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Logout and revoke refresh token."""
     # Revoke all active refresh tokens for this user
     result = await db.execute(
-        select(RefreshToken).where(
+        update(RefreshToken)
+        .where(
             RefreshToken.user_id == current_user.id,
             RefreshToken.revoked == False,  # noqa: E712
         )
+        .values(revoked=True)
+        .returning(RefreshToken.token_hash, RefreshToken.expires_at)
     )
-    tokens = result.scalars().all()
-
-    for token in tokens:
-        token.revoked = True
-
+    revoked_tokens = result.tuples().all()
     await db.commit()
+    await token_revocation.mark_revoked(revoked_tokens)
 
     # Clear refresh token cookie
+    response = _message_response(_LOGGED_OUT_BODY)
     response.delete_cookie(key="refresh_token", domain=_cookie_domain(), path="/")
-
-    return MessageResponse(message="Logged out successfully")
+    return response
 
 
 @router.get("/auth/me", response_model=UserResponse)
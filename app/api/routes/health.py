@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
+
+from app.core.config import settings
+from app.db.session import engine
 
 router = APIRouter()
 
@@ -6,3 +9,11 @@ router = APIRouter()
 @router.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@router.get("/debug/pool", include_in_schema=False)
+async def pool_status():
+    """Report connection pool usage; only available when debug is enabled."""
+    if not settings.debug:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return {"status": engine.pool.status()}
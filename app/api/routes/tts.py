@@ -1,37 +1,95 @@
 """TTS API routes for dataset management and audio processing."""
 
+import asyncio
+import base64
+import binascii
+import contextlib
+from datetime import datetime
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
     Form,
     HTTPException,
+    Query,
+    Response,
     UploadFile,
     status,
 )
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import Row, delete, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_current_active_user
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.tts_dataset import DatasetStatus, TTSDataset, TranscriptType
 from app.models.user import User
 from app.schemas.tts import (
+    DatasetConfirm,
     DatasetListResponse,
     DatasetResponse,
+    DatasetUploadRequest,
+    DatasetUploadResponse,
+    PresignedPost,
 )
 from app.services import audio_processor, s3
 
 router = APIRouter(prefix="/tts", tags=["tts"])
 
+_DATASET_LIST_ADAPTER = TypeAdapter(list[DatasetListResponse])
+# Only the columns the list response serializes; S3 keys, error_message and
+# the rest are left out of the query instead of hydrated and discarded.
+_DATASET_LIST_COLUMNS = tuple(
+    getattr(TTSDataset, name) for name in DatasetListResponse.model_fields
+)
+_REPROCESSABLE_STATUSES = (DatasetStatus.PENDING.value, DatasetStatus.FAILED.value)
+_TRANSCRIPT_TYPE_VALUES = frozenset(t.value for t in TranscriptType)
+_INVALID_TRANSCRIPT_TYPE_DETAIL = (
+    f"Invalid transcript_type. Must be one of: {[t.value for t in TranscriptType]}"
+)
+
+
+def _encode_cursor(dataset: Row) -> str:
+    raw = f"{dataset.created_at.isoformat()}|{dataset.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    created_at, _, dataset_id = raw.partition("|")
+    parsed = datetime.fromisoformat(created_at)
+    # created_at is a naive column; an aware value would fail in the driver.
+    if parsed.tzinfo is not None:
+        raise ValueError("Invalid cursor")
+    return parsed, UUID(dataset_id)
+
+
+def _dataset_s3_keys(
+    user_id: UUID, dataset_id: UUID, audio_extension: str, transcript_type: str
+) -> tuple[str, str]:
+    prefix = f"users/{user_id}/datasets/{dataset_id}"
+    transcript_ext = "srt" if transcript_type == "srt" else "txt"
+    return (
+        f"{prefix}/source_audio.{audio_extension}",
+        f"{prefix}/transcript.{transcript_ext}",
+    )
+
+
+def _transcript_content_type(transcript_type: str) -> str:
+    return "application/x-subrip" if transcript_type == "srt" else "text/plain"
+
 
 @router.post("/datasets", response_model=DatasetResponse, status_code=status.HTTP_201_CREATED)
 async def create_dataset(
-    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     transcript: UploadFile = File(...),
     name: str = Form(...),
@@ -43,98 +101,238 @@ async def create_dataset(
 ):
     """Upload audio and transcript files to create a new dataset."""
     # Validate transcript type
-    if transcript_type not in [t.value for t in TranscriptType]:
+    if transcript_type not in _TRANSCRIPT_TYPE_VALUES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid transcript_type. Must be one of: {[t.value for t in TranscriptType]}",
+            detail=_INVALID_TRANSCRIPT_TYPE_DETAIL,
         )
 
-    # Read and validate audio file
-    audio_data = await audio.read()
-    is_valid, error = audio_processor.validate_audio_file(audio_data)
+    # Validate the spooled upload in place; decoding blocks, so run it off-loop
+    is_valid, error = await run_in_threadpool(
+        audio_processor.validate_audio_file, audio.file
+    )
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error,
         )
 
-    # Read transcript file
-    transcript_data = await transcript.read()
-
     # Create dataset record
-    from uuid import uuid4
-
     dataset_id = uuid4()
 
     # Upload files to S3
     audio_extension = Path(audio.filename or "").suffix.lower().lstrip(".") or "wav"
-    audio_s3_key = (
-        f"users/{current_user.id}/datasets/{dataset_id}/source_audio.{audio_extension}"
+    audio_s3_key, transcript_s3_key = _dataset_s3_keys(
+        current_user.id, dataset_id, audio_extension, transcript_type
     )
-    transcript_ext = "srt" if transcript_type == "srt" else "txt"
-    transcript_s3_key = f"users/{current_user.id}/datasets/{dataset_id}/transcript.{transcript_ext}"
 
-    try:
-        audio_content_type = audio.content_type or "application/octet-stream"
-        transcript_content_type = (
-            "application/x-subrip" if transcript_type == "srt" else "text/plain"
-        )
-        s3.upload_file(audio_s3_key, audio_data, content_type=audio_content_type)
-        s3.upload_file(
+    audio_content_type = audio.content_type or "application/octet-stream"
+    transcript_content_type = _transcript_content_type(transcript_type)
+    # Stream both spooled uploads to S3 concurrently, off the event loop. Wait
+    # for both to settle so a failure can't race the other upload's cleanup.
+    results = await asyncio.gather(
+        run_in_threadpool(
+            s3.upload_file,
+            audio_s3_key,
+            audio.file,
+            content_type=audio_content_type,
+        ),
+        run_in_threadpool(
+            s3.upload_file,
             transcript_s3_key,
-            transcript_data,
+            transcript.file,
             content_type=transcript_content_type,
-        )
-    except Exception as e:
+        ),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        # Don't leave half a dataset behind in the bucket
+        with contextlib.suppress(Exception):
+            await run_in_threadpool(s3.delete_files, [audio_s3_key, transcript_s3_key])
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload files: {str(e)}",
+            detail=f"Failed to upload files: {str(errors[0])}",
         )
 
-    # Create database record
-    dataset = TTSDataset(
-        id=dataset_id,
-        user_id=current_user.id,
-        name=name,
-        description=description,
-        audio_s3_key=audio_s3_key,
-        transcript_s3_key=transcript_s3_key,
-        transcript_type=transcript_type,
-        status=DatasetStatus.PROCESSING.value
-        if auto_process
-        else DatasetStatus.PENDING.value,
-        error_message=None,
-    )
-    db.add(dataset)
-    await db.commit()
-    await db.refresh(dataset)
-
-    if auto_process:
-        background_tasks.add_task(
-            _process_dataset_task,
+    # Create database record; auto_process queues it for the dataset worker
+    # INSERT ... RETURNING hands back the server defaults without a refresh
+    dataset = await db.scalar(
+        insert(TTSDataset)
+        .values(
+            id=dataset_id,
             user_id=current_user.id,
-            dataset_id=dataset_id,
+            name=name,
+            description=description,
             audio_s3_key=audio_s3_key,
             transcript_s3_key=transcript_s3_key,
             transcript_type=transcript_type,
+            status=DatasetStatus.PROCESSING.value
+            if auto_process
+            else DatasetStatus.PENDING.value,
+            error_message=None,
         )
+        .returning(TTSDataset)
+    )
+    await db.commit()
+
+    return dataset
+
+
+@router.post("/datasets/uploads", response_model=DatasetUploadResponse)
+async def create_dataset_upload(
+    request: DatasetUploadRequest,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Presign direct-to-S3 uploads for a new dataset's audio and transcript.
+
+    The client POSTs each file straight to S3 with the returned form fields,
+    then calls /datasets/confirm to create the dataset.
+    """
+    dataset_id = uuid4()
+    transcript_type = request.transcript_type.value
+    audio_s3_key, transcript_s3_key = _dataset_s3_keys(
+        current_user.id, dataset_id, request.audio_extension, transcript_type
+    )
+    expires_in = settings.upload_url_expire_seconds
+
+    audio_post, transcript_post = await asyncio.gather(
+        run_in_threadpool(
+            s3.generate_presigned_post,
+            audio_s3_key,
+            request.audio_content_type,
+            settings.max_audio_file_size_mb * 1024 * 1024,
+            expires_in,
+        ),
+        run_in_threadpool(
+            s3.generate_presigned_post,
+            transcript_s3_key,
+            _transcript_content_type(transcript_type),
+            settings.max_transcript_file_size_mb * 1024 * 1024,
+            expires_in,
+        ),
+    )
+
+    return DatasetUploadResponse(
+        dataset_id=dataset_id,
+        audio=PresignedPost(s3_key=audio_s3_key, **audio_post),
+        transcript=PresignedPost(s3_key=transcript_s3_key, **transcript_post),
+        expires_in=expires_in,
+    )
+
+
+@router.post(
+    "/datasets/confirm",
+    response_model=DatasetResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def confirm_dataset_upload(
+    request: DatasetConfirm,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create a dataset from files uploaded directly to S3."""
+    transcript_type = request.transcript_type.value
+    audio_s3_key, transcript_s3_key = _dataset_s3_keys(
+        current_user.id, request.dataset_id, request.audio_extension, transcript_type
+    )
+
+    audio_head, transcript_head = await asyncio.gather(
+        run_in_threadpool(s3.head_file, audio_s3_key),
+        run_in_threadpool(s3.head_file, transcript_s3_key),
+    )
+    if audio_head is None or transcript_head is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Audio and transcript must be uploaded before confirming",
+        )
+    size_mb = audio_head["ContentLength"] / (1024 * 1024)
+    if size_mb > settings.max_audio_file_size_mb:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"File size ({size_mb:.1f}MB) exceeds maximum "
+                f"({settings.max_audio_file_size_mb}MB)"
+            ),
+        )
+
+    # The audio is decoded by the worker, which fails the dataset if it is invalid
+    try:
+        dataset = await db.scalar(
+            insert(TTSDataset)
+            .values(
+                id=request.dataset_id,
+                user_id=current_user.id,
+                name=request.name,
+                description=request.description,
+                audio_s3_key=audio_s3_key,
+                transcript_s3_key=transcript_s3_key,
+                transcript_type=transcript_type,
+                status=DatasetStatus.PROCESSING.value
+                if request.auto_process
+                else DatasetStatus.PENDING.value,
+                error_message=None,
+            )
+            .returning(TTSDataset)
+        )
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Dataset already confirmed",
+        ) from None
 
     return dataset
 
 
 @router.get("/datasets", response_model=list[DatasetListResponse])
 async def list_datasets(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all datasets for the current user."""
-    result = await db.execute(
-        select(TTSDataset)
+    """List the current user's datasets, newest first, one page at a time.
+
+    When more datasets remain, the X-Next-Cursor response header holds the
+    cursor to pass back for the next page.
+    """
+    stmt = (
+        select(*_DATASET_LIST_COLUMNS)
         .where(TTSDataset.user_id == current_user.id)
-        .order_by(TTSDataset.created_at.desc())
+        .order_by(TTSDataset.created_at.desc(), TTSDataset.id.desc())
+        .limit(limit + 1)
     )
-    datasets = result.scalars().all()
-    return datasets
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        # Keyset pagination: seek past the last row instead of counting an offset
+        stmt = stmt.where(
+            tuple_(TTSDataset.created_at, TTSDataset.id)
+            < (cursor_created_at, cursor_id)
+        )
+
+    result = await db.execute(stmt)
+    datasets = result.all()
+    page = datasets[:limit]
+
+    # Validate from the rows and dump straight to JSON bytes in
+    # pydantic-core, skipping FastAPI's intermediate dict serialization.
+    response = Response(
+        content=_DATASET_LIST_ADAPTER.dump_json(
+            _DATASET_LIST_ADAPTER.validate_python(page, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
+    if len(datasets) > limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(page[-1])
+    return response
 
 
 @router.get("/datasets/{dataset_id}", response_model=DatasetResponse)
@@ -168,116 +366,70 @@ async def delete_dataset(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a dataset."""
+    # Ownership check and delete in one statement
     result = await db.execute(
-        select(TTSDataset).where(
+        delete(TTSDataset)
+        .where(
             TTSDataset.id == dataset_id,
             TTSDataset.user_id == current_user.id,
         )
+        .returning(TTSDataset.id)
     )
-    dataset = result.scalar_one_or_none()
+    deleted_id = result.scalar_one_or_none()
+    await db.commit()
 
-    if not dataset:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Dataset not found",
         )
 
-    await db.delete(dataset)
-    await db.commit()
-
-
-async def _process_dataset_task(
-    user_id: UUID,
-    dataset_id: UUID,
-    audio_s3_key: str,
-    transcript_s3_key: str,
-    transcript_type: str,
-):
-    """Background task to process dataset."""
-    from app.db.session import async_session
-
-    async with async_session() as db:
-        result = await db.execute(
-            select(TTSDataset).where(TTSDataset.id == dataset_id)
-        )
-        dataset = result.scalar_one_or_none()
-
-        if not dataset:
-            return
-
-        try:
-            # Update status to processing
-            dataset.status = DatasetStatus.PROCESSING.value
-            await db.commit()
-
-            # Process the dataset
-            processing_result = await audio_processor.process_dataset(
-                user_id=user_id,
-                dataset_id=dataset_id,
-                audio_s3_key=audio_s3_key,
-                transcript_s3_key=transcript_s3_key,
-                transcript_type=transcript_type,
-            )
-
-            if processing_result.error:
-                dataset.status = DatasetStatus.FAILED.value
-                dataset.error_message = processing_result.error
-            else:
-                dataset.status = DatasetStatus.READY.value
-                dataset.segment_count = len(processing_result.segments)
-                dataset.total_duration_seconds = processing_result.total_duration_seconds
-                dataset.training_data_s3_key = f"users/{user_id}/datasets/{dataset_id}/training_data.jsonl"
-
-            await db.commit()
-
-        except Exception as e:
-            dataset.status = DatasetStatus.FAILED.value
-            dataset.error_message = str(e)
-            await db.commit()
-
 
 @router.post("/datasets/{dataset_id}/process", response_model=DatasetResponse)
 async def process_dataset(
     dataset_id: UUID,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger processing (segmentation) of a dataset."""
+    # Queue for the dataset worker (app.worker) in one statement: ownership and
+    # the status guard live in the WHERE clause.
     result = await db.execute(
-        select(TTSDataset).where(
+        update(TTSDataset)
+        .where(
             TTSDataset.id == dataset_id,
             TTSDataset.user_id == current_user.id,
+            TTSDataset.status.in_(_REPROCESSABLE_STATUSES),
+        )
+        .values(
+            status=DatasetStatus.PROCESSING.value,
+            error_message=None,
+            processing_started_at=None,
         )
+        .returning(TTSDataset)
     )
     dataset = result.scalar_one_or_none()
+    await db.commit()
 
-    if not dataset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Dataset not found",
+    if dataset:
+        return dataset
+
+    # Only the error path pays a second query, to pick 404 vs 400
+    result = await db.execute(
+        select(TTSDataset.status).where(
+            TTSDataset.id == dataset_id,
+            TTSDataset.user_id == current_user.id,
         )
+    )
+    current_status = result.scalar_one_or_none()
 
-    if dataset.status not in [DatasetStatus.PENDING.value, DatasetStatus.FAILED.value]:
+    if current_status is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Dataset cannot be processed in current status: {dataset.status}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found",
         )
 
-    # Start background processing
-    background_tasks.add_task(
-        _process_dataset_task,
-        user_id=current_user.id,
-        dataset_id=dataset_id,
-        audio_s3_key=dataset.audio_s3_key,
-        transcript_s3_key=dataset.transcript_s3_key,
-        transcript_type=dataset.transcript_type,
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Dataset cannot be processed in current status: {current_status}",
     )
-
-    # Update status
-    dataset.status = DatasetStatus.PROCESSING.value
-    dataset.error_message = None
-    await db.commit()
-    await db.refresh(dataset)
-
-    return dataset
@@ -1,27 +1,137 @@
+import asyncio
+import base64
 import hashlib
 import hmac
+import os
 import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from app.core.config import settings
 
+# Verified token payloads keyed by the raw token, evicted at the token's own exp.
+_DECODE_CACHE_MAXSIZE = 10_000
+_decode_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+# The HS256 header never changes, so it is serialized and encoded once.
+_HS256_HEADER_SEGMENT = base64.urlsafe_b64encode(
+    orjson.dumps({"alg": "HS256", "typ": "JWT"})
+).rstrip(b"=")
+
+_password_hasher = PasswordHasher(
+    time_cost=settings.password_hash_time_cost,
+    memory_cost=settings.password_hash_memory_kib,
+    parallelism=settings.password_hash_parallelism,
+)
+
+# Hashes written before the Argon2id switch; verified with bcrypt, then rehashed.
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# argon2 and bcrypt release the GIL, so hashing in threads keeps the loop responsive.
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-    )
+    """Verify a plain password against an Argon2id or legacy bcrypt hash."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True if a hash is legacy bcrypt or uses outdated Argon2 parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    """Hash a password using Argon2id."""
+    return _password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_pool, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_pool, get_password_hash, password)
+
+
+_dummy_password_hash: str | None = None
+
+
+async def dummy_password_hash() -> str:
+    """Return a throwaway password hash used to equalize login timing.
+
+    Computed once on the hashing pool; the app lifespan warms it at startup
+    so the first unknown-email login isn't slower than the rest.
+    """
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = await get_password_hash_async(secrets.token_urlsafe(16))
+    return _dummy_password_hash
+
+
+@cache
+def _signing_key(secret: str, algorithm: str) -> Any:
+    # Parse the key once (a PEM load for asymmetric algorithms) instead of
+    # letting PyJWT re-prepare it on every encode/decode.
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+
+
+@cache
+def _verifying_key(secret: str, algorithm: str) -> Any:
+    key = _signing_key(secret, algorithm)
+    # Asymmetric private keys verify through their public half.
+    return key.public_key() if hasattr(key, "public_key") else key
+
+
+def encode_token(payload: dict[str, Any]) -> str:
+    """Encode and sign a JWT, handling datetime claims like PyJWT does."""
+    claims = {
+        key: int(value.timestamp()) if isinstance(value, datetime) else value
+        for key, value in payload.items()
+    }
+    if settings.jwt_algorithm != "HS256":
+        return jwt.encode(
+            claims,
+            _signing_key(settings.jwt_secret_key, settings.jwt_algorithm),
+            algorithm=settings.jwt_algorithm,
+        )
+
+    # HS256 fast path: reuse the pre-encoded header and sign with hmac directly.
+    payload_segment = base64.urlsafe_b64encode(orjson.dumps(claims)).rstrip(b"=")
+    signing_input = _HS256_HEADER_SEGMENT + b"." + payload_segment
+    signature = hmac.new(
+        _signing_key(settings.jwt_secret_key, "HS256"), signing_input, hashlib.sha256
+    ).digest()
+    return (
+        signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")
+    ).decode("ascii")
 
 
 def create_access_token(
@@ -36,10 +146,7 @@ def create_access_token(
             minutes=settings.access_token_expire_minutes
         )
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
-    return encoded_jwt
+    return encode_token(to_encode)
 
 
 def create_refresh_token(
@@ -51,32 +158,62 @@ def create_refresh_token(
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+    # jti keeps tokens unique even when rotated within the same second.
+    to_encode.update(
+        {"exp": expire, "type": "refresh", "jti": secrets.token_urlsafe(16)}
     )
-    return encoded_jwt
+    return encode_token(to_encode)
 
 
 def decode_token(token: str) -> dict[str, Any]:
     """Decode and validate a JWT token."""
     try:
         payload = jwt.decode(
-            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+            token,
+            _verifying_key(settings.jwt_secret_key, settings.jwt_algorithm),
+            algorithms=[settings.jwt_algorithm],
         )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise ValueError("Invalid token")
 
 
-def generate_token_hash(token: str) -> str:
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """Decode a JWT token, reusing the verified payload until the token expires.
+
+    Only successfully verified tokens are cached; invalid tokens always go
+    through a full decode so failures are never memoized.
+    """
+    payload = _decode_cache.get(token)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            _decode_cache.move_to_end(token)
+            return dict(payload)
+        del _decode_cache[token]
+
+    payload = decode_token(token)
+    if isinstance(payload.get("exp"), int | float):
+        _decode_cache[token] = payload
+        if len(_decode_cache) > _DECODE_CACHE_MAXSIZE:
+            _decode_cache.popitem(last=False)
+    return dict(payload)
+
+
+@cache
+def _token_hash_key(secret: str) -> bytes:
+    # BLAKE2b keys are capped at 64 bytes, so derive a fixed-size key.
+    return hashlib.blake2b(secret.encode("utf-8"), digest_size=32).digest()
+
+
+def generate_token_hash(token: str) -> bytes:
     """Generate a hash of the token for storage in database."""
-    # Use HMAC-SHA256 to avoid bcrypt length limits and keep tokens irreversible.
-    return hmac.new(
-        settings.jwt_secret_key.encode("utf-8"),
+    # Keyed BLAKE2b acts as a MAC with the secret as pepper; tokens stay
+    # irreversible and the raw 32-byte digest is stored without hex encoding.
+    return hashlib.blake2b(
         token.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+        digest_size=32,
+        key=_token_hash_key(settings.jwt_secret_key),
+    ).digest()
 
 
 def generate_verification_token() -> str:
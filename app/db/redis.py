@@ -0,0 +1,22 @@
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_client: Redis | None = None
+
+
+def get_redis() -> Redis | None:
+    """Return the shared Redis client, or None when Redis is not configured."""
+    global _client
+    if not settings.redis_url:
+        return None
+    if _client is None:
+        _client = Redis.from_url(settings.redis_url)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,13 +1,51 @@
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.database_url)
+connect_args = {}
+if make_url(settings.database_url).get_driver_name() == "asyncpg":
+    cache_size = 0 if settings.db_pgbouncer else settings.db_statement_cache_size
+    connect_args = {
+        "prepared_statement_cache_size": cache_size,
+        "statement_cache_size": cache_size,
+    }
+    if settings.db_pgbouncer:
+        # asyncpg names statements __asyncpg_stmt_N__ per connection, and
+        # those names collide on PgBouncer's shared server connections.
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+if settings.db_pgbouncer:
+    pool_kwargs = {"poolclass": NullPool}
+else:
+    pool_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+engine = create_async_engine(
+    settings.database_url,
+    connect_args=connect_args,
+    **pool_kwargs,
+)
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
     async with async_session() as session:
         yield session
+
+
+def insert_for(session: AsyncSession, entity):
+    """Return the session dialect's INSERT construct (supports ON CONFLICT)."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(entity)
+    return postgresql.insert(entity)
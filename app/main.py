@@ -2,15 +2,22 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.security import dummy_password_hash
+from app.db.redis import close_redis
 from app.db.session import engine
+from app.services.http_client import close_http_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await dummy_password_hash()
     yield
+    await close_http_client()
+    await close_redis()
     await engine.dispose()
 
 
@@ -21,6 +28,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -30,6 +38,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(api_router)
@@ -2,7 +2,18 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    text,
+)
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -21,12 +32,31 @@ class TranscriptType(str, Enum):
     SRT = "srt"
 
 
+_UNCLAIMED_WHERE = "status = 'processing' AND processing_started_at IS NULL"
+
+
 class TTSDataset(Base):
     __tablename__ = "tts_datasets"
+    __table_args__ = (
+        # Matches list_datasets' keyset order and serves user_id lookups alike.
+        Index(
+            "ix_tts_datasets_user_id_created_at_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Queue of datasets waiting for a worker to claim them.
+        Index(
+            "ix_tts_datasets_unclaimed",
+            "created_at",
+            postgresql_where=text(_UNCLAIMED_WHERE),
+            sqlite_where=text(_UNCLAIMED_WHERE),
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4, index=True)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
     user_id: Mapped[UUID] = mapped_column(
-        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -35,13 +65,21 @@ class TTSDataset(Base):
     transcript_type: Mapped[str] = mapped_column(
         String(10), default=TranscriptType.TEXT.value, nullable=False
     )
+    # A native Postgres enum: four bytes per row and in the status index
     status: Mapped[str] = mapped_column(
-        String(20), default=DatasetStatus.PENDING.value, nullable=False, index=True
+        SAEnum(*(s.value for s in DatasetStatus), name="dataset_status"),
+        default=DatasetStatus.PENDING.value,
+        nullable=False,
+        index=True,
     )
     segment_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     total_duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
     training_data_s3_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set when a worker claims the dataset; NULL while it waits in the queue.
+    processing_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False
     )
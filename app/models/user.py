@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, String, Text, Uuid
+from sqlalchemy import Boolean, DateTime, Index, LargeBinary, String, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -10,8 +10,23 @@ from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_google_sub",
+            "google_sub",
+            unique=True,
+            postgresql_where=text("google_sub IS NOT NULL"),
+            sqlite_where=text("google_sub IS NOT NULL"),
+        ),
+        Index(
+            "ix_users_email_verification_token_hash",
+            "email_verification_token_hash",
+            postgresql_where=text("email_verification_token_hash IS NOT NULL"),
+            sqlite_where=text("email_verification_token_hash IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4, index=True)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
     email: Mapped[str] = mapped_column(
         String(255), unique=True, index=True, nullable=False
     )
@@ -20,15 +35,13 @@ class User(Base):
     last_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    email_verification_token_hash: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    email_verification_token_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32), nullable=True
     )
     email_verification_expires_at: Mapped[datetime | None] = mapped_column(
-        nullable=True
-    )
-    google_sub: Mapped[str | None] = mapped_column(
-        String(255), nullable=True, index=True
+        DateTime(timezone=True), nullable=True
     )
+    google_sub: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False
     )
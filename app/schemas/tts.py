@@ -17,6 +17,31 @@ class DatasetCreate(BaseModel):
     transcript_type: TranscriptType = TranscriptType.TEXT
 
 
+class DatasetUploadRequest(BaseModel):
+    transcript_type: TranscriptType = TranscriptType.TEXT
+    audio_extension: str = Field("wav", pattern=r"^[a-z0-9]{1,10}$")
+    audio_content_type: str = Field("application/octet-stream", max_length=255)
+
+
+class PresignedPost(BaseModel):
+    url: str
+    fields: dict[str, str]
+    s3_key: str
+
+
+class DatasetUploadResponse(BaseModel):
+    dataset_id: UUID
+    audio: PresignedPost
+    transcript: PresignedPost
+    expires_in: int
+
+
+class DatasetConfirm(DatasetCreate):
+    dataset_id: UUID
+    audio_extension: str = Field("wav", pattern=r"^[a-z0-9]{1,10}$")
+    auto_process: bool = True
+
+
 class DatasetUpdate(BaseModel):
     name: str | None = Field(None, min_length=1, max_length=255)
     description: str | None = None
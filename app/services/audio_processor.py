@@ -5,12 +5,23 @@ Handles:
 - Training data JSONL generation
 """
 
-import json
+import asyncio
+import gzip
 import logging
+import multiprocessing
+import os
+import struct
+import wave
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from io import BytesIO
+from typing import BinaryIO
 from uuid import UUID
 
+import orjson
 import pysrt
 from pydub import AudioSegment
 
@@ -20,6 +31,20 @@ from app.services import s3
 logger = logging.getLogger(__name__)
 
 
+# Decoding and segmenting is CPU-bound Python, so datasets are processed in
+# child processes: the caller's event loop stays responsive and concurrent
+# datasets use separate cores. Spawn rather than fork so children don't
+# inherit the parent's event loop or pooled S3 connections.
+def _new_processing_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=settings.dataset_worker_concurrency,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+_processing_pool = _new_processing_pool()
+
+
 @dataclass
 class AudioSegmentData:
     """Represents a segmented audio clip with its transcript."""
@@ -32,14 +57,26 @@ class AudioSegmentData:
     duration_seconds: float
 
 
+@dataclass
+class SegmentMetadata:
+    """A segment's timing and transcript, kept after its audio is uploaded."""
+
+    index: int
+    start_ms: int
+    end_ms: int
+    text: str
+    duration_seconds: float
+
+
 @dataclass
 class ProcessingResult:
     """Result of audio processing."""
 
-    segments: list[AudioSegmentData]
+    segments: list[SegmentMetadata]
     total_duration_seconds: float
-    training_data_jsonl: str
+    training_data_jsonl: bytes
     segment_s3_keys: list[str]
+    training_data_s3_key: str | None = None
     error: str | None = None
 
 
@@ -56,22 +93,13 @@ def parse_srt_file(srt_content: str) -> list[dict]:
     entries = []
 
     for sub in subs:
-        start_ms = (
-            sub.start.hours * 3600000
-            + sub.start.minutes * 60000
-            + sub.start.seconds * 1000
-            + sub.start.milliseconds
-        )
-        end_ms = (
-            sub.end.hours * 3600000
-            + sub.end.minutes * 60000
-            + sub.end.seconds * 1000
-            + sub.end.milliseconds
-        )
         text = sub.text.replace("\n", " ").strip()
 
         if text:
-            entries.append({"start_ms": start_ms, "end_ms": end_ms, "text": text})
+            # ordinal is the timestamp in milliseconds
+            entries.append(
+                {"start_ms": sub.start.ordinal, "end_ms": sub.end.ordinal, "text": text}
+            )
 
     return entries
 
@@ -96,51 +124,79 @@ def parse_plain_text(text_content: str, audio_duration_ms: int) -> list[dict]:
     return [{"start_ms": 0, "end_ms": audio_duration_ms, "text": text}]
 
 
-def segment_audio_by_timestamps(
-    audio_data: bytes, timestamps: list[dict]
-) -> list[AudioSegmentData]:
-    """Segment audio file based on timestamp entries.
+def _wav_header(
+    data_size: int, channels: int, sample_width: int, frame_rate: int
+) -> bytes:
+    """Build the 44-byte RIFF header for a PCM WAV with data_size bytes of frames."""
+    frame_width = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        frame_rate,
+        frame_rate * frame_width,
+        frame_width,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+def iter_segments(
+    audio: AudioSegment, timestamps: list[dict]
+) -> Iterator[AudioSegmentData]:
+    """Yield audio segments one at a time based on timestamp entries.
 
     Args:
-        audio_data: Raw audio file bytes
+        audio: Decoded source audio
         timestamps: List of dicts with start_ms, end_ms, text
 
-    Returns:
-        List of AudioSegmentData
+    Yields:
+        AudioSegmentData with the segment as WAV bytes
     """
-    audio = AudioSegment.from_file(BytesIO(audio_data))
-    segments = []
+    duration_ms = len(audio)
+    frame_width = audio.frame_width
+    # Slice the decoded PCM directly and prepend a WAV header, instead of
+    # building an AudioSegment and running it through export() per segment.
+    # 8-bit WAV stores unsigned samples, so that rare case keeps pydub's export.
+    pcm = memoryview(audio.raw_data) if audio.sample_width > 1 else None
 
     for i, ts in enumerate(timestamps):
         start_ms = ts["start_ms"]
         end_ms = ts["end_ms"]
-        text = ts["text"]
-
-        # Extract segment
-        segment = audio[start_ms:end_ms]
-
-        # Export to WAV bytes
-        buffer = BytesIO()
-        segment.export(buffer, format="wav")
-        audio_bytes = buffer.getvalue()
-
-        duration = (end_ms - start_ms) / 1000.0
-
-        segments.append(
-            AudioSegmentData(
-                index=i,
-                start_ms=start_ms,
-                end_ms=end_ms,
-                text=text,
-                audio_data=audio_bytes,
-                duration_seconds=duration,
+
+        if pcm is None:
+            buffer = BytesIO()
+            audio[start_ms:end_ms].export(buffer, format="wav")
+            audio_bytes = buffer.getvalue()
+        else:
+            # Same millisecond-to-frame rounding as pydub's slicing
+            start = int(audio.frame_count(ms=min(start_ms, duration_ms))) * frame_width
+            end = int(audio.frame_count(ms=min(end_ms, duration_ms))) * frame_width
+            frames = pcm[start:end]
+            header = _wav_header(
+                len(frames), audio.channels, audio.sample_width, audio.frame_rate
             )
+            audio_bytes = b"".join((header, frames))
+
+        yield AudioSegmentData(
+            index=i,
+            start_ms=start_ms,
+            end_ms=end_ms,
+            text=ts["text"],
+            audio_data=audio_bytes,
+            duration_seconds=(end_ms - start_ms) / 1000.0,
         )
 
-    return segments
 
-
-def generate_training_jsonl(segments: list[AudioSegmentData], s3_keys: list[str]) -> str:
+def generate_training_jsonl(
+    segments: list[SegmentMetadata], s3_keys: list[str]
+) -> bytes:
     """Generate JSONL training data.
 
     Args:
@@ -148,18 +204,18 @@ def generate_training_jsonl(segments: list[AudioSegmentData], s3_keys: list[str]
         s3_keys: S3 keys for the segment audio files
 
     Returns:
-        JSONL string for training
+        UTF-8 JSONL bytes for training, ready to upload
     """
-    lines = []
-    for segment, s3_key in zip(segments, s3_keys):
-        entry = {
-            "audio_path": s3_key,
-            "text": segment.text,
-            "duration": segment.duration_seconds,
-        }
-        lines.append(json.dumps(entry))
-
-    return "\n".join(lines)
+    return b"\n".join(
+        orjson.dumps(
+            {
+                "audio_path": s3_key,
+                "text": segment.text,
+                "duration": segment.duration_seconds,
+            }
+        )
+        for segment, s3_key in zip(segments, s3_keys)
+    )
 
 
 async def process_dataset(
@@ -168,6 +224,41 @@ async def process_dataset(
     audio_s3_key: str,
     transcript_s3_key: str,
     transcript_type: str,
+) -> ProcessingResult:
+    """Run process_dataset_sync in the processing pool.
+
+    Raises BrokenProcessPool if a child process died (e.g. OOM-killed); the
+    pool is replaced first so later datasets still run.
+    """
+    global _processing_pool
+    pool = _processing_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            pool,
+            process_dataset_sync,
+            user_id,
+            dataset_id,
+            audio_s3_key,
+            transcript_s3_key,
+            transcript_type,
+        )
+    except BrokenProcessPool:
+        # A broken pool rejects every later submit. Concurrent callers see
+        # the same failure; only the first swaps in a new pool.
+        if _processing_pool is pool:
+            logger.warning("Processing pool broke; starting a new one")
+            pool.shutdown(wait=False, cancel_futures=True)
+            _processing_pool = _new_processing_pool()
+        raise
+
+
+def process_dataset_sync(
+    user_id: UUID,
+    dataset_id: UUID,
+    audio_s3_key: str,
+    transcript_s3_key: str,
+    transcript_type: str,
 ) -> ProcessingResult:
     """Process a dataset: download, segment, and upload training data.
 
@@ -182,17 +273,34 @@ async def process_dataset(
         ProcessingResult with segments and training data
     """
     try:
-        # Download audio and transcript from S3
-        logger.info(f"Downloading audio from {audio_s3_key}")
-        audio_data = s3.download_file(audio_s3_key)
-
-        logger.info(f"Downloading transcript from {transcript_s3_key}")
-        transcript_data = s3.download_file(transcript_s3_key)
+        # Download audio and transcript from S3 concurrently; the transcript
+        # is fetched on this thread while the audio downloads on another
+        logger.info(f"Downloading {audio_s3_key} and {transcript_s3_key}")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            audio_future = pool.submit(s3.download_file, audio_s3_key)
+            transcript_data = s3.download_file(transcript_s3_key)
+            audio_data = audio_future.result()
         transcript_text = transcript_data.decode("utf-8", errors="replace")
 
-        # Get audio duration for plain text processing
-        audio = AudioSegment.from_file(BytesIO(audio_data))
+        # Presigned uploads never pass through validate_audio_file, so enforce
+        # its format and duration limits here; a WAV header is checked before
+        # the whole file is decoded
+        audio_file = BytesIO(audio_data)
+        duration_error = _duration_error(_wav_header_duration(audio_file))
+        if duration_error:
+            return _failed_result(duration_error)
+
+        # Decode once; segments are sliced from this and the compressed
+        # download is no longer needed
+        try:
+            audio = AudioSegment.from_file(audio_file)
+        except Exception as e:
+            return _failed_result(f"Invalid audio file: {e}")
+        del audio_data, audio_file
         audio_duration_ms = len(audio)
+        duration_error = _duration_error(audio_duration_ms / 1000.0)
+        if duration_error:
+            return _failed_result(duration_error)
 
         # Parse timestamps based on transcript type
         if transcript_type == "srt":
@@ -203,35 +311,53 @@ async def process_dataset(
             timestamps = parse_plain_text(transcript_text, audio_duration_ms)
 
         if not timestamps:
-            return ProcessingResult(
-                segments=[],
-                total_duration_seconds=0,
-                training_data_jsonl="",
-                segment_s3_keys=[],
-                error="No valid segments found in transcript",
-            )
+            return _failed_result("No valid segments found in transcript")
 
-        # Segment audio
+        # Segment and upload as we go, so only the clips still in flight are
+        # held in memory rather than every segment of the dataset
         logger.info(f"Segmenting audio into {len(timestamps)} segments")
-        segments = segment_audio_by_timestamps(audio_data, timestamps)
-
-        # Upload segments to S3
-        segment_s3_keys = []
         base_path = f"users/{user_id}/datasets/{dataset_id}/segments"
-
-        for segment in segments:
-            segment_key = f"{base_path}/segment_{segment.index:05d}.wav"
-            s3.upload_file(segment_key, segment.audio_data, content_type="audio/wav")
-            segment_s3_keys.append(segment_key)
-            logger.info(f"Uploaded segment {segment.index} to {segment_key}")
+        segments: list[SegmentMetadata] = []
+        segment_s3_keys: list[str] = []
+        max_in_flight = 2 * settings.s3_upload_concurrency
+        in_flight: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=settings.s3_upload_concurrency) as pool:
+            for segment in iter_segments(audio, timestamps):
+                if len(in_flight) >= max_in_flight:
+                    in_flight.popleft().result()
+                segment_key = f"{base_path}/segment_{segment.index:05d}.wav"
+                in_flight.append(
+                    pool.submit(
+                        s3.upload_file,
+                        segment_key,
+                        segment.audio_data,
+                        content_type="audio/wav",
+                    )
+                )
+                segments.append(
+                    SegmentMetadata(
+                        index=segment.index,
+                        start_ms=segment.start_ms,
+                        end_ms=segment.end_ms,
+                        text=segment.text,
+                        duration_seconds=segment.duration_seconds,
+                    )
+                )
+                segment_s3_keys.append(segment_key)
+            for future in in_flight:
+                future.result()
+        logger.info(f"Uploaded {len(segment_s3_keys)} segments to {base_path}")
 
         # Generate and upload training JSONL
         training_jsonl = generate_training_jsonl(segments, segment_s3_keys)
-        training_key = f"users/{user_id}/datasets/{dataset_id}/training_data.jsonl"
+        # The repetitive keys and paths compress several-fold; a fast level is
+        # plenty for that
+        training_key = f"users/{user_id}/datasets/{dataset_id}/training_data.jsonl.gz"
         s3.upload_file(
             training_key,
-            training_jsonl.encode("utf-8"),
+            gzip.compress(training_jsonl, compresslevel=3),
             content_type="application/jsonl",
+            content_encoding="gzip",
         )
         logger.info(f"Uploaded training data to {training_key}")
 
@@ -243,17 +369,22 @@ async def process_dataset(
             total_duration_seconds=total_duration,
             training_data_jsonl=training_jsonl,
             segment_s3_keys=segment_s3_keys,
+            training_data_s3_key=training_key,
         )
 
     except Exception as e:
         logger.exception("Error processing dataset")
-        return ProcessingResult(
-            segments=[],
-            total_duration_seconds=0,
-            training_data_jsonl="",
-            segment_s3_keys=[],
-            error=str(e),
-        )
+        return _failed_result(str(e))
+
+
+def _failed_result(error: str) -> ProcessingResult:
+    return ProcessingResult(
+        segments=[],
+        total_duration_seconds=0,
+        training_data_jsonl=b"",
+        segment_s3_keys=[],
+        error=error,
+    )
 
 
 def get_audio_duration(audio_data: bytes) -> float:
@@ -269,31 +400,59 @@ def get_audio_duration(audio_data: bytes) -> float:
     return len(audio) / 1000.0
 
 
-def validate_audio_file(audio_data: bytes) -> tuple[bool, str | None]:
+def _wav_header_duration(audio_file: BinaryIO) -> float | None:
+    """Read a PCM WAV's duration from its header, or None if it isn't one."""
+    try:
+        with wave.open(audio_file, "rb") as wav:
+            frame_rate = wav.getframerate()
+            if frame_rate <= 0:
+                return None
+            return wav.getnframes() / frame_rate
+    except (wave.Error, EOFError):
+        return None
+    finally:
+        audio_file.seek(0)
+
+
+def _duration_error(duration_seconds: float | None) -> str | None:
+    """Return an error message if the duration exceeds the configured maximum."""
+    limit = settings.max_audio_duration_seconds
+    if duration_seconds is None or duration_seconds <= limit:
+        return None
+    return f"Duration ({duration_seconds:.0f}s) exceeds maximum ({limit}s)"
+
+
+def validate_audio_file(audio_file: BinaryIO) -> tuple[bool, str | None]:
     """Validate audio file format and size.
 
+    The file is left rewound to the start so it can be streamed afterwards.
+
     Args:
-        audio_data: Raw audio file bytes
+        audio_file: Seekable binary file object with the uploaded audio
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check file size
-    size_mb = len(audio_data) / (1024 * 1024)
+    # Check file size without reading the file into memory
+    size_mb = audio_file.seek(0, os.SEEK_END) / (1024 * 1024)
+    audio_file.seek(0)
     if size_mb > settings.max_audio_file_size_mb:
         return False, f"File size ({size_mb:.1f}MB) exceeds maximum ({settings.max_audio_file_size_mb}MB)"
 
     try:
-        audio = AudioSegment.from_file(BytesIO(audio_data))
-        duration_seconds = len(audio) / 1000.0
+        # PCM WAV carries its length in the header, so skip decoding it whole
+        duration_seconds = _wav_header_duration(audio_file)
+        if duration_seconds is None:
+            audio = AudioSegment.from_file(audio_file)
+            duration_seconds = len(audio) / 1000.0
 
-        if duration_seconds > settings.max_audio_duration_seconds:
-            return (
-                False,
-                f"Duration ({duration_seconds:.0f}s) exceeds maximum ({settings.max_audio_duration_seconds}s)",
-            )
+        duration_error = _duration_error(duration_seconds)
+        if duration_error:
+            return False, duration_error
 
         return True, None
 
     except Exception as e:
         return False, f"Invalid audio file: {str(e)}"
+    finally:
+        audio_file.seek(0)
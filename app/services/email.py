@@ -1,24 +1,32 @@
 import logging
+from functools import cache
 from pathlib import Path
 
 import httpx
 
 from app.core.config import settings
+from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
 
 
+@cache
+def _read_template(filename: str) -> str:
+    # Read errors raise, and functools.cache doesn't store exceptions, so a
+    # failed read is retried on the next email rather than remembered.
+    return (TEMPLATE_DIR / filename).read_text(encoding="utf-8")
+
+
 def _load_template(filename: str) -> str:
-    path = TEMPLATE_DIR / filename
     try:
-        return path.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        logger.warning("Email template missing: %s", path)
+        return _read_template(filename)
+    except OSError:
+        logger.warning("Email template unreadable: %s", TEMPLATE_DIR / filename)
         return ""
 
 
-def send_verification_email(to_email: str, token: str) -> None:
+async def send_verification_email(to_email: str, token: str) -> None:
     """Send an email verification link via Resend."""
     if not settings.resend_api_key or not settings.resend_from_email:
         logger.warning("Resend not configured; skipping verification email.")
@@ -54,15 +62,14 @@ def send_verification_email(to_email: str, token: str) -> None:
     }
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                "https://api.resend.com/emails",
-                headers={
-                    "Authorization": f"Bearer {settings.resend_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            response.raise_for_status()
+        response = await get_http_client().post(
+            "https://api.resend.com/emails",
+            headers={
+                "Authorization": f"Bearer {settings.resend_api_key}",
+                "Content-Type": "application/json",
+            },
+            json=payload,
+        )
+        response.raise_for_status()
     except httpx.HTTPError:
         logger.exception("Failed to send verification email via Resend.")
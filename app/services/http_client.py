@@ -0,0 +1,20 @@
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared outbound HTTP client, reusing pooled connections."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0, limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
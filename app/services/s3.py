@@ -1,20 +1,30 @@
+from functools import cache
 from io import BytesIO
+from typing import BinaryIO
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from app.core.config import settings
 
 
+# Clients are thread-safe but creating them from the shared default session is
+# not, so build one lazily and reuse it across threadpool uploads.
+@cache
 def get_s3_client():
+    # Enough pooled connections for every concurrent segment upload.
+    config = Config(max_pool_connections=max(10, settings.s3_upload_concurrency))
     if settings.aws_profile:
         session = boto3.Session(
             profile_name=settings.aws_profile,
             region_name=settings.aws_region,
         )
-        return session.client("s3")
+        return session.client("s3", config=config)
 
     kwargs = {
         "region_name": settings.aws_region,
+        "config": config,
     }
     # Use explicit credentials if provided (for temp credentials with session token)
     if settings.aws_access_key_id:
@@ -25,18 +35,56 @@ def get_s3_client():
     return boto3.client("s3", **kwargs)
 
 
-def upload_file(key: str, data: bytes, content_type: str = "application/octet-stream"):
+# Below boto3's multipart threshold a transfer is a single request anyway.
+_SINGLE_REQUEST_MAX_BYTES = 8 * 1024 * 1024
+
+
+def upload_file(
+    key: str,
+    data: bytes | BinaryIO,
+    content_type: str = "application/octet-stream",
+    content_encoding: str | None = None,
+):
+    extra_args = {"ContentType": content_type}
+    if content_encoding:
+        extra_args["ContentEncoding"] = content_encoding
     client = get_s3_client()
+    # Small in-memory payloads go straight to put_object, skipping the
+    # transfer manager's threads and the BytesIO wrapper.
+    if isinstance(data, bytes) and len(data) < _SINGLE_REQUEST_MAX_BYTES:
+        client.put_object(
+            Bucket=settings.s3_bucket_name, Key=key, Body=data, **extra_args
+        )
+        return
+    # File objects are streamed in multipart chunks rather than buffered.
+    fileobj = BytesIO(data) if isinstance(data, bytes) else data
     client.upload_fileobj(
-        BytesIO(data),
+        fileobj,
         settings.s3_bucket_name,
         key,
-        ExtraArgs={"ContentType": content_type},
+        ExtraArgs=extra_args,
+    )
+
+
+def delete_files(keys: list[str]) -> None:
+    client = get_s3_client()
+    client.delete_objects(
+        Bucket=settings.s3_bucket_name,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
     )
 
 
 def download_file(key: str) -> bytes:
     client = get_s3_client()
+    # Small objects (transcripts) come back in a single GET; larger ones are
+    # left to the transfer manager's parallel ranged downloads.
+    response = client.get_object(Bucket=settings.s3_bucket_name, Key=key)
+    body = response["Body"]
+    if response["ContentLength"] < _SINGLE_REQUEST_MAX_BYTES:
+        with body:
+            return body.read()
+    body.close()
+
     buffer = BytesIO()
     client.download_fileobj(settings.s3_bucket_name, key, buffer)
     buffer.seek(0)
@@ -50,3 +98,32 @@ def generate_presigned_url(key: str, expiration: int = 3600) -> str:
         Params={"Bucket": settings.s3_bucket_name, "Key": key},
         ExpiresIn=expiration,
     )
+
+
+def generate_presigned_post(
+    key: str, content_type: str, max_bytes: int, expiration: int = 600
+) -> dict:
+    """Presign a browser POST of one object, capped at max_bytes."""
+    client = get_s3_client()
+    return client.generate_presigned_post(
+        settings.s3_bucket_name,
+        key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 0, max_bytes],
+        ],
+        ExpiresIn=expiration,
+    )
+
+
+def head_file(key: str) -> dict | None:
+    """Return the object's metadata, or None if it does not exist."""
+    client = get_s3_client()
+    try:
+        return client.head_object(Bucket=settings.s3_bucket_name, Key=key)
+    except ClientError as exc:
+        code = exc.response.get("Error", {}).get("Code")
+        if code in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
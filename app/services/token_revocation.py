@@ -0,0 +1,48 @@
+"""Redis mirror of revoked refresh tokens.
+
+Postgres stays the source of truth; Redis only lets the refresh endpoint
+reject an already-revoked token without a database round trip. Every
+operation is best-effort and a no-op when Redis is not configured.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
+from redis.exceptions import RedisError
+
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "revoked_refresh:"
+
+
+def _key(token_hash: bytes) -> str:
+    return f"{KEY_PREFIX}{token_hash.hex()}"
+
+
+async def is_revoked(token_hash: bytes) -> bool:
+    """Return True if the token hash is known to be revoked."""
+    redis = get_redis()
+    if redis is None:
+        return False
+    try:
+        return bool(await redis.exists(_key(token_hash)))
+    except RedisError:
+        logger.warning("Redis unavailable; skipping revoked-token check.")
+        return False
+
+
+async def mark_revoked(tokens: Iterable[tuple[bytes, datetime]]) -> None:
+    """Record revoked token hashes until their expiry."""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for token_hash, expires_at in tokens:
+                pipe.set(_key(token_hash), 1, exat=int(expires_at.timestamp()))
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Redis unavailable; revoked tokens not mirrored.")
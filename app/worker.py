@@ -0,0 +1,235 @@
+"""Dataset processing worker.
+
+The API only marks datasets as ``processing``; this worker claims them from
+Postgres one at a time with ``SELECT ... FOR UPDATE SKIP LOCKED`` so any
+number of workers can run without processing the same dataset twice, and
+audio work never competes with request handling in the API process.
+
+The queue lives in the table, so it survives restarts and redeploys: a
+worker refreshes its claim while it works, and a claim not refreshed within
+``dataset_worker_claim_timeout_seconds`` (the worker crashed or was killed)
+is picked up again by the next worker. Outcomes are only written while the
+claim is still the worker's own, so a reclaimed dataset is finished once.
+
+Run with ``python -m app.worker``.
+"""
+
+import asyncio
+import logging
+import signal
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import async_session, engine
+from app.models.tts_dataset import DatasetStatus, TTSDataset
+from app.services import audio_processor
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the retry delay after repeated claim loop failures.
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+async def claim_next_dataset(db: AsyncSession) -> TTSDataset | None:
+    """Claim the oldest queued or abandoned dataset, or None if there is none."""
+    now = datetime.now(UTC)
+    stale_before = now - timedelta(
+        seconds=settings.dataset_worker_claim_timeout_seconds
+    )
+    result = await db.execute(
+        select(TTSDataset)
+        .where(
+            TTSDataset.status == DatasetStatus.PROCESSING.value,
+            or_(
+                TTSDataset.processing_started_at.is_(None),
+                TTSDataset.processing_started_at < stale_before,
+            ),
+        )
+        .order_by(TTSDataset.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    dataset = result.scalar_one_or_none()
+    if dataset is None:
+        return None
+
+    dataset.processing_started_at = now
+    await db.commit()
+    return dataset
+
+
+@dataclass
+class _Claim:
+    """A worker's hold on a dataset: the processing_started_at it last wrote."""
+
+    dataset_id: UUID
+    stamp: datetime | None
+
+
+async def _renew_claim(claim: _Claim, done: asyncio.Event) -> None:
+    """Refresh the claim stamp until done is set, so it never looks abandoned."""
+    interval = settings.dataset_worker_claim_timeout_seconds / 3
+    while True:
+        try:
+            await asyncio.wait_for(done.wait(), timeout=interval)
+            return
+        except TimeoutError:
+            pass
+        now = datetime.now(UTC)
+        try:
+            async with async_session() as db:
+                result = await db.execute(
+                    update(TTSDataset)
+                    .where(
+                        TTSDataset.id == claim.dataset_id,
+                        TTSDataset.processing_started_at == claim.stamp,
+                    )
+                    .values(processing_started_at=now)
+                )
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to renew claim on dataset %s", claim.dataset_id)
+            continue
+        if result.rowcount == 0:
+            logger.warning("Lost claim on dataset %s", claim.dataset_id)
+            return
+        claim.stamp = now
+
+
+async def _record_outcome(db: AsyncSession, claim: _Claim, values: dict) -> bool:
+    """Write a processing outcome; False if the claim is gone.
+
+    The claim is gone when the dataset was deleted, or when another worker
+    reclaimed it and now owns the outcome.
+    """
+    result = await db.execute(
+        update(TTSDataset)
+        .where(
+            TTSDataset.id == claim.dataset_id,
+            TTSDataset.processing_started_at == claim.stamp,
+        )
+        .values(**values)
+    )
+    await db.commit()
+    if result.rowcount == 0:
+        logger.info(
+            "Dropping result for dataset %s: deleted or reclaimed while processing",
+            claim.dataset_id,
+        )
+        return False
+    return True
+
+
+async def process_claimed_dataset(db: AsyncSession, dataset: TTSDataset) -> None:
+    """Segment a claimed dataset and record the outcome."""
+    # Read up front: a rollback below expires the instance.
+    claim = _Claim(dataset_id=dataset.id, stamp=dataset.processing_started_at)
+    done = asyncio.Event()
+    renewal = asyncio.create_task(_renew_claim(claim, done))
+    try:
+        processing_result = await audio_processor.process_dataset(
+            user_id=dataset.user_id,
+            dataset_id=claim.dataset_id,
+            audio_s3_key=dataset.audio_s3_key,
+            transcript_s3_key=dataset.transcript_s3_key,
+            transcript_type=dataset.transcript_type,
+        )
+    except BrokenProcessPool:
+        # A pool child died, possibly while running another dataset; the pool
+        # has been replaced, so release the claim for a retry.
+        logger.exception("Processing pool broke on dataset %s", claim.dataset_id)
+        values = {"processing_started_at": None}
+    except Exception as e:
+        logger.exception("Failed to process dataset %s", claim.dataset_id)
+        values = {"status": DatasetStatus.FAILED.value, "error_message": str(e)}
+    else:
+        if processing_result.error:
+            values = {
+                "status": DatasetStatus.FAILED.value,
+                "error_message": processing_result.error,
+            }
+        else:
+            values = {
+                "status": DatasetStatus.READY.value,
+                "segment_count": len(processing_result.segments),
+                "total_duration_seconds": processing_result.total_duration_seconds,
+                "training_data_s3_key": processing_result.training_data_s3_key,
+            }
+    finally:
+        # Stop renewing between updates rather than cancelling one mid-write,
+        # so claim.stamp matches what the database holds.
+        done.set()
+        await renewal
+
+    try:
+        await _record_outcome(db, claim, values)
+    except Exception as e:
+        logger.exception("Failed to record outcome for dataset %s", claim.dataset_id)
+        # The session may be mid-transaction or failed; start clean.
+        await db.rollback()
+        await _record_outcome(
+            db,
+            claim,
+            {"status": DatasetStatus.FAILED.value, "error_message": str(e)},
+        )
+
+
+async def run_worker(stop: asyncio.Event) -> None:
+    """Run dataset_worker_concurrency claim loops until stop is set."""
+    await asyncio.gather(
+        *(_claim_loop(stop) for _ in range(settings.dataset_worker_concurrency))
+    )
+
+
+async def _claim_loop(stop: asyncio.Event) -> None:
+    """Process queued datasets until stop is set, polling while idle.
+
+    Errors are logged and retried with exponential backoff so a transient
+    database failure doesn't take the worker down; only stop ends the loop.
+    """
+    failures = 0
+    while not stop.is_set():
+        try:
+            async with async_session() as db:
+                dataset = await claim_next_dataset(db)
+                if dataset is not None:
+                    await process_claimed_dataset(db, dataset)
+        except Exception:
+            failures += 1
+            delay = min(
+                settings.dataset_worker_poll_seconds * 2**failures,
+                _MAX_BACKOFF_SECONDS,
+            )
+            logger.exception("Dataset worker iteration failed; retrying in %ss", delay)
+        else:
+            failures = 0
+            if dataset is not None:
+                continue
+            delay = settings.dataset_worker_poll_seconds
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    # Finish the dataset in hand on SIGTERM/SIGINT instead of abandoning it.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await run_worker(stop)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""store dataset status as a native enum
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-15 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: str | Sequence[str] | None = "f2a3b4c5d6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+dataset_status = postgresql.ENUM(
+    "pending", "processing", "ready", "failed", name="dataset_status"
+)
+
+UNCLAIMED_WHERE = "status = 'processing' AND processing_started_at IS NULL"
+
+
+def upgrade() -> None:
+    """Convert tts_datasets.status from varchar to the dataset_status enum."""
+    dataset_status.create(op.get_bind())
+    # The partial queue index compares status to a text literal; rebuild it
+    # against the enum rather than carry the varchar comparison over.
+    op.drop_index("ix_tts_datasets_unclaimed", table_name="tts_datasets")
+    # The varchar 'pending' default can't be cast automatically, so drop it
+    # across the type change and restore it as an enum literal.
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=sa.String(length=20),
+        server_default=None,
+    )
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=sa.String(length=20),
+        type_=dataset_status,
+        existing_nullable=False,
+        postgresql_using="status::dataset_status",
+    )
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=dataset_status,
+        server_default=sa.text("'pending'::dataset_status"),
+    )
+    op.create_index(
+        "ix_tts_datasets_unclaimed",
+        "tts_datasets",
+        ["created_at"],
+        postgresql_where=sa.text(UNCLAIMED_WHERE),
+    )
+
+
+def downgrade() -> None:
+    """Convert tts_datasets.status back to varchar."""
+    op.drop_index("ix_tts_datasets_unclaimed", table_name="tts_datasets")
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=dataset_status,
+        server_default=None,
+    )
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=dataset_status,
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.alter_column(
+        "tts_datasets",
+        "status",
+        existing_type=sa.String(length=20),
+        server_default=sa.text("'pending'"),
+    )
+    op.create_index(
+        "ix_tts_datasets_unclaimed",
+        "tts_datasets",
+        ["created_at"],
+        postgresql_where=sa.text(UNCLAIMED_WHERE),
+    )
+    dataset_status.drop(op.get_bind())
@@ -0,0 +1,33 @@
+"""add partial index on active refresh tokens per user
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | Sequence[str] | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index active refresh tokens by user for bulk revocation on logout."""
+    op.create_index(
+        "ix_refresh_tokens_user_id_active",
+        "refresh_tokens",
+        ["user_id"],
+        postgresql_where=sa.text("revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the active refresh token user index."""
+    op.drop_index("ix_refresh_tokens_user_id_active", table_name="refresh_tokens")
@@ -0,0 +1,62 @@
+"""refine lookup indexes for users and tts datasets
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: str | Sequence[str] | None = "b8c9d0e1f2a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Make lookup indexes partial/unique and add a dataset listing index."""
+    # Google accounts map to exactly one user; most users have no google_sub.
+    op.drop_index("ix_users_google_sub", table_name="users")
+    op.create_index(
+        "ix_users_google_sub",
+        "users",
+        ["google_sub"],
+        unique=True,
+        postgresql_where=sa.text("google_sub IS NOT NULL"),
+    )
+    # Only unverified users carry a verification token. The original full index
+    # was lost when 40e2259b7701 rebuilt users, so it may not exist here.
+    op.drop_index(
+        "ix_users_email_verification_token_hash", table_name="users", if_exists=True
+    )
+    op.create_index(
+        "ix_users_email_verification_token_hash",
+        "users",
+        ["email_verification_token_hash"],
+        postgresql_where=sa.text("email_verification_token_hash IS NOT NULL"),
+    )
+    # (user_id, created_at DESC) serves list_datasets' ORDER BY and supersedes
+    # the single-column user_id index.
+    op.create_index(
+        "ix_tts_datasets_user_id_created_at",
+        "tts_datasets",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_tts_datasets_user_id", table_name="tts_datasets")
+
+
+def downgrade() -> None:
+    """Restore the indexes that existed at the down revision."""
+    op.create_index(
+        "ix_tts_datasets_user_id", "tts_datasets", ["user_id"], unique=False
+    )
+    op.drop_index("ix_tts_datasets_user_id_created_at", table_name="tts_datasets")
+    # No verification token index exists at the down revision.
+    op.drop_index("ix_users_email_verification_token_hash", table_name="users")
+    op.drop_index("ix_users_google_sub", table_name="users")
+    op.create_index("ix_users_google_sub", "users", ["google_sub"], unique=False)
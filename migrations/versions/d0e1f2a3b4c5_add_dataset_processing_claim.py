@@ -0,0 +1,42 @@
+"""add dataset processing claim for the worker queue
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: str | Sequence[str] | None = "c9d0e1f2a3b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add processing_started_at and index unclaimed datasets."""
+    # Datasets already marked processing were owned by in-process background
+    # tasks; leaving the claim NULL hands them to the worker.
+    op.add_column(
+        "tts_datasets",
+        sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_tts_datasets_unclaimed",
+        "tts_datasets",
+        ["created_at"],
+        postgresql_where=sa.text(
+            "status = 'processing' AND processing_started_at IS NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the processing claim column and its index."""
+    op.drop_index("ix_tts_datasets_unclaimed", table_name="tts_datasets")
+    op.drop_column("tts_datasets", "processing_started_at")
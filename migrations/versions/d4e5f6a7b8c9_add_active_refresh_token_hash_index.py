@@ -0,0 +1,48 @@
+"""add partial unique index on active refresh token hashes
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | Sequence[str] | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Revoke legacy and duplicate refresh tokens and index active hashes."""
+    # Legacy rows stored the raw JWT instead of its hash; they are no longer
+    # looked up, so revoke them rather than keep a second lookup path.
+    op.execute(
+        "UPDATE refresh_tokens SET revoked = true "
+        "WHERE revoked = false AND token_hash LIKE '%.%.%'"
+    )
+    # Tokens issued in the same second before the jti claim existed can share
+    # a hash; keep the newest active row per hash so the unique index builds.
+    op.execute(
+        "UPDATE refresh_tokens SET revoked = true "
+        "WHERE revoked = false AND id NOT IN ("
+        "SELECT DISTINCT ON (token_hash) id FROM refresh_tokens "
+        "WHERE revoked = false ORDER BY token_hash, created_at DESC, id)"
+    )
+    op.create_index(
+        "ix_refresh_tokens_token_hash_active",
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+        postgresql_where=sa.text("revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the active refresh token hash index."""
+    op.drop_index("ix_refresh_tokens_token_hash_active", table_name="refresh_tokens")
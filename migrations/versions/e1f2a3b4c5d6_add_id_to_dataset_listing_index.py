@@ -0,0 +1,38 @@
+"""add id to the dataset listing index for keyset pagination
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: str | Sequence[str] | None = "d0e1f2a3b4c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index datasets in list_datasets' (created_at, id) keyset order."""
+    op.create_index(
+        "ix_tts_datasets_user_id_created_at_id",
+        "tts_datasets",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("ix_tts_datasets_user_id_created_at", table_name="tts_datasets")
+
+
+def downgrade() -> None:
+    """Restore the two-column listing index."""
+    op.create_index(
+        "ix_tts_datasets_user_id_created_at",
+        "tts_datasets",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_tts_datasets_user_id_created_at_id", table_name="tts_datasets")
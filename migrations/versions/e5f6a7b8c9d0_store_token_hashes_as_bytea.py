@@ -0,0 +1,67 @@
+"""store token hashes as raw bytea digests
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | Sequence[str] | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert token hash columns from hex text to bytea."""
+    # Existing HMAC-SHA256 hashes cannot be mapped to BLAKE2b digests: drop
+    # outstanding refresh tokens (users sign in again) and pending
+    # verification tokens (users request a new verification email).
+    op.execute("DELETE FROM refresh_tokens")
+    op.execute(
+        "UPDATE users SET email_verification_token_hash = NULL, "
+        "email_verification_expires_at = NULL "
+        "WHERE email_verification_token_hash IS NOT NULL"
+    )
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+    op.alter_column(
+        "users",
+        "email_verification_token_hash",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="decode(email_verification_token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Convert token hash columns back to hex text."""
+    op.alter_column(
+        "users",
+        "email_verification_token_hash",
+        type_=sa.Text(),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=True,
+        postgresql_using="encode(email_verification_token_hash, 'hex')",
+    )
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        type_=sa.Text(),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
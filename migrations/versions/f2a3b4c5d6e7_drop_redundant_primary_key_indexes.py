@@ -0,0 +1,33 @@
+"""drop indexes that duplicate the primary keys
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: str | Sequence[str] | None = "e1f2a3b4c5d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop the id indexes; each primary key already has its own unique index."""
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_refresh_tokens_id"), table_name="refresh_tokens")
+    op.drop_index(op.f("ix_tts_datasets_id"), table_name="tts_datasets")
+
+
+def downgrade() -> None:
+    """Recreate the id indexes."""
+    op.create_index(op.f("ix_tts_datasets_id"), "tts_datasets", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_refresh_tokens_id"), "refresh_tokens", ["id"], unique=False
+    )
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
@@ -0,0 +1,42 @@
+"""use timezone aware timestamp for email verification expiry
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: str | Sequence[str] | None = "e5f6a7b8c9d0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert users.email_verification_expires_at to timezone-aware."""
+    op.alter_column(
+        "users",
+        "email_verification_expires_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using="email_verification_expires_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    """Revert users.email_verification_expires_at to naive."""
+    op.alter_column(
+        "users",
+        "email_verification_expires_at",
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="email_verification_expires_at AT TIME ZONE 'UTC'",
+    )
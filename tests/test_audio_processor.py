@@ -0,0 +1,190 @@
+import asyncio
+import gzip
+import io
+import json
+import wave
+from concurrent.futures.process import BrokenProcessPool
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.services import audio_processor
+
+
+def _wav_bytes(seconds: float, frame_rate: int = 8000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(frame_rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * frame_rate))
+    return buffer.getvalue()
+
+
+def test_validate_wav_reads_duration_from_header(monkeypatch):
+    def no_decode(*args, **kwargs):
+        raise AssertionError("WAV files should not be fully decoded")
+
+    monkeypatch.setattr(audio_processor.AudioSegment, "from_file", no_decode)
+    audio_file = io.BytesIO(_wav_bytes(1.5))
+
+    assert audio_processor.validate_audio_file(audio_file) == (True, None)
+    assert audio_file.tell() == 0
+
+
+def test_validate_wav_rejects_long_duration_from_header(monkeypatch):
+    monkeypatch.setattr(settings, "max_audio_duration_seconds", 1)
+
+    is_valid, error = audio_processor.validate_audio_file(io.BytesIO(_wav_bytes(2)))
+
+    assert not is_valid
+    assert "Duration" in error
+
+
+def test_process_dataset_uploads_segments_and_training_data(monkeypatch):
+    source = audio_processor.AudioSegment(
+        data=b"\x00\x00" * 8000 * 3, sample_width=2, frame_rate=8000, channels=1
+    )
+    transcript = (
+        b"1\n00:00:00,000 --> 00:00:01,000\nHello there\n\n"
+        b"2\n00:00:01,500 --> 00:00:02,500\nGeneral\nKenobi\n"
+    )
+    uploaded = {}
+    encodings = {}
+
+    def fake_upload(
+        key, data, content_type="application/octet-stream", content_encoding=None
+    ):
+        uploaded[key] = data
+        encodings[key] = content_encoding
+
+    monkeypatch.setattr(
+        audio_processor.s3,
+        "download_file",
+        lambda key: transcript if key.endswith(".srt") else b"audio",
+    )
+    monkeypatch.setattr(audio_processor.s3, "upload_file", fake_upload)
+    monkeypatch.setattr(
+        audio_processor.AudioSegment, "from_file", lambda *args, **kwargs: source
+    )
+
+    result = audio_processor.process_dataset_sync(
+        "user", "dataset", "source_audio.wav", "transcript.srt", "srt"
+    )
+
+    assert result.error is None
+    assert [s.text for s in result.segments] == ["Hello there", "General Kenobi"]
+    assert result.total_duration_seconds == 2.0
+    assert result.segment_s3_keys == [
+        "users/user/datasets/dataset/segments/segment_00000.wav",
+        "users/user/datasets/dataset/segments/segment_00001.wav",
+    ]
+    with wave.open(io.BytesIO(uploaded[result.segment_s3_keys[1]])) as wav:
+        assert wav.getnframes() == 8000
+    assert result.training_data_s3_key == (
+        "users/user/datasets/dataset/training_data.jsonl.gz"
+    )
+    assert encodings[result.training_data_s3_key] == "gzip"
+    training = gzip.decompress(uploaded[result.training_data_s3_key])
+    assert [json.loads(line) for line in training.splitlines()] == [
+        {"audio_path": key, "text": segment.text, "duration": 1.0}
+        for key, segment in zip(result.segment_s3_keys, result.segments)
+    ]
+
+
+def test_iter_segments_matches_pydub_export():
+    source = audio_processor.AudioSegment(
+        data=bytes(range(256)) * 375, sample_width=2, frame_rate=16000, channels=2
+    )
+    timestamps = [
+        {"start_ms": 0, "end_ms": 250, "text": "first"},
+        {"start_ms": 333, "end_ms": 10_000, "text": "past the end"},
+    ]
+
+    for segment, ts in zip(
+        audio_processor.iter_segments(source, timestamps), timestamps
+    ):
+        expected = io.BytesIO()
+        source[ts["start_ms"] : ts["end_ms"]].export(expected, format="wav")
+        assert segment.audio_data == expected.getvalue()
+
+
+def test_parse_srt_file_converts_timestamps_to_milliseconds():
+    entries = audio_processor.parse_srt_file(
+        "1\n01:02:03,456 --> 01:02:04,000\nTwo\nlines\n\n"
+        "2\n01:02:05,000 --> 01:02:06,000\n \n"
+    )
+
+    assert entries == [{"start_ms": 3723456, "end_ms": 3724000, "text": "Two lines"}]
+
+
+def test_process_dataset_rejects_long_wav_before_decoding(monkeypatch):
+    def no_decode(*args, **kwargs):
+        raise AssertionError("an over-long WAV should not be decoded")
+
+    monkeypatch.setattr(settings, "max_audio_duration_seconds", 1)
+    monkeypatch.setattr(
+        audio_processor.s3,
+        "download_file",
+        lambda key: b"Hello" if key.endswith(".txt") else _wav_bytes(2),
+    )
+    monkeypatch.setattr(audio_processor.AudioSegment, "from_file", no_decode)
+
+    result = audio_processor.process_dataset_sync(
+        "user", "dataset", "source_audio.wav", "transcript.txt", "text"
+    )
+
+    assert result.error == "Duration (2s) exceeds maximum (1s)"
+    assert result.segments == []
+
+
+def test_process_dataset_rejects_long_decoded_audio(monkeypatch):
+    source = audio_processor.AudioSegment(
+        data=b"\x00\x00" * 8000 * 3, sample_width=2, frame_rate=8000, channels=1
+    )
+    monkeypatch.setattr(settings, "max_audio_duration_seconds", 2)
+    monkeypatch.setattr(
+        audio_processor.s3,
+        "download_file",
+        lambda key: b"Hello" if key.endswith(".txt") else b"mp3 audio",
+    )
+    monkeypatch.setattr(
+        audio_processor.AudioSegment, "from_file", lambda *args, **kwargs: source
+    )
+
+    result = audio_processor.process_dataset_sync(
+        "user", "dataset", "source_audio.mp3", "transcript.txt", "text"
+    )
+
+    assert result.error == "Duration (3s) exceeds maximum (2s)"
+
+
+def test_process_dataset_replaces_broken_pool(monkeypatch):
+    class BrokenPool:
+        shut_down = False
+
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("child process terminated abruptly")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = BrokenPool()
+    replacement = object()
+    monkeypatch.setattr(audio_processor, "_processing_pool", broken)
+    monkeypatch.setattr(audio_processor, "_new_processing_pool", lambda: replacement)
+
+    with pytest.raises(BrokenProcessPool):
+        asyncio.run(
+            audio_processor.process_dataset(
+                user_id=uuid4(),
+                dataset_id=uuid4(),
+                audio_s3_key="audio.wav",
+                transcript_s3_key="transcript.srt",
+                transcript_type="srt",
+            )
+        )
+
+    assert broken.shut_down
+    assert audio_processor._processing_pool is replacement
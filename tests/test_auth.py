@@ -1,8 +1,12 @@
 import asyncio
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+import bcrypt
 from sqlalchemy import select
 
+from app.api.routes import auth as auth_routes
+from app.core import security
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 
@@ -33,6 +37,15 @@ async def _set_user_active(async_session_maker, user_id: UUID, active: bool) ->
         await session.commit()
 
 
+async def _update_user(async_session_maker, user_id: UUID, **fields) -> None:
+    async with async_session_maker() as session:
+        result = await session.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one()
+        for name, value in fields.items():
+            setattr(user, name, value)
+        await session.commit()
+
+
 def _register_user(client, email="test@example.com", password="password123"):
     return client.post(
         "/auth/register",
@@ -49,6 +62,20 @@ def _login_user(client, email="test@example.com", password="password123"):
     return client.post("/auth/login", json={"email": email, "password": password})
 
 
+def _login_verified_user(client, async_session_maker, email):
+    _register_user(client, email=email)
+    user = _run(_get_user_by_email(async_session_maker, email))
+    _run(_update_user(async_session_maker, user.id, is_verified=True))
+    response = _login_user(client, email=email)
+    assert response.status_code == 200
+    return response
+
+
+def _use_refresh_cookie(client, token):
+    client.cookies.clear()
+    client.cookies.set("refresh_token", token)
+
+
 def test_register_and_login_and_me(client, async_session_maker):
     register_response = _register_user(client)
     assert register_response.status_code == 201
@@ -75,21 +102,103 @@ def test_register_duplicate_fails(client):
     assert duplicate_response.status_code == 400
 
 
+def test_register_normalizes_email_case(client, async_session_maker):
+    response = _register_user(client, email="Mixed.Case@Example.com")
+    assert response.status_code == 201
+
+    user = _run(_get_user_by_email(async_session_maker, "mixed.case@example.com"))
+    assert user is not None
+
+
 def test_login_invalid_password(client):
     _register_user(client, email="badpass@example.com", password="password123")
     response = _login_user(client, email="badpass@example.com", password="wrongpass")
     assert response.status_code == 401
 
 
+def test_login_unknown_email_still_verifies_password(client, monkeypatch):
+    checked = []
+
+    async def fake_verify(plain: str, hashed: str) -> bool:
+        checked.append(hashed)
+        return False
+
+    monkeypatch.setattr(auth_routes, "verify_password_async", fake_verify)
+
+    response = _login_user(client, email="missing@example.com")
+
+    assert response.status_code == 401
+    assert checked == [_run(security.dummy_password_hash())]
+
+
+def test_login_rehashes_legacy_bcrypt_password(client, async_session_maker):
+    _register_user(client, email="legacy@example.com")
+    user = _run(_get_user_by_email(async_session_maker, "legacy@example.com"))
+    legacy = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    _run(
+        _update_user(
+            async_session_maker, user.id, hashed_password=legacy, is_verified=True
+        )
+    )
+
+    response = _login_user(client, email="legacy@example.com")
+
+    assert response.status_code == 200
+    user = _run(_get_user_by_email(async_session_maker, "legacy@example.com"))
+    assert user.hashed_password.startswith("$argon2id$")
+    assert security.verify_password("password123", user.hashed_password)
+
+
+def _set_verification_token(async_session_maker, email, token, expires_in):
+    user = _run(_get_user_by_email(async_session_maker, email))
+    _run(
+        _update_user(
+            async_session_maker,
+            user.id,
+            email_verification_token_hash=security.generate_token_hash(token),
+            email_verification_expires_at=datetime.now(UTC) + expires_in,
+        )
+    )
+
+
+def test_verify_email_consumes_token(client, async_session_maker):
+    _register_user(client, email="verified@example.com")
+    _set_verification_token(
+        async_session_maker, "verified@example.com", "verify-token", timedelta(hours=1)
+    )
+
+    response = client.post("/auth/verify-email", json={"token": "verify-token"})
+
+    assert response.status_code == 200
+    user = _run(_get_user_by_email(async_session_maker, "verified@example.com"))
+    assert user.is_verified is True
+    assert user.email_verification_token_hash is None
+    assert user.email_verification_expires_at is None
+
+    reused = client.post("/auth/verify-email", json={"token": "verify-token"})
+    assert reused.status_code == 400
+
+
+def test_verify_email_rejects_expired_token(client, async_session_maker):
+    _register_user(client, email="expired@example.com")
+    _set_verification_token(
+        async_session_maker, "expired@example.com", "expired-token", -timedelta(days=1)
+    )
+
+    response = client.post("/auth/verify-email", json={"token": "expired-token"})
+
+    assert response.status_code == 400
+    user = _run(_get_user_by_email(async_session_maker, "expired@example.com"))
+    assert user.is_verified is False
+
+
 def test_me_requires_auth(client):
     response = client.get("/auth/me")
     assert response.status_code == 403 or response.status_code == 401
 
 
 def test_refresh_token_rotation(client, async_session_maker):
-    _register_user(client, email="refresh@example.com")
-    login_response = _login_user(client, email="refresh@example.com")
-    assert login_response.status_code == 200
+    _login_verified_user(client, async_session_maker, "refresh@example.com")
 
     refresh_response = client.post("/auth/refresh")
     assert refresh_response.status_code == 200
@@ -101,21 +210,73 @@ def test_refresh_token_rotation(client, async_session_maker):
     assert any(token.revoked for token in tokens)
 
 
+def test_refresh_token_works_once(client, async_session_maker):
+    _login_verified_user(client, async_session_maker, "reuse@example.com")
+    old_token = client.cookies["refresh_token"]
+
+    assert client.post("/auth/refresh").status_code == 200
+    new_token = client.cookies["refresh_token"]
+    assert new_token != old_token
+
+    _use_refresh_cookie(client, old_token)
+    assert client.post("/auth/refresh").status_code == 401
+
+    _use_refresh_cookie(client, new_token)
+    assert client.post("/auth/refresh").status_code == 200
+
+    user = _run(_get_user_by_email(async_session_maker, "reuse@example.com"))
+    tokens = _run(_get_refresh_tokens(async_session_maker, user.id))
+    assert len(tokens) == 3
+    assert [token.revoked for token in tokens].count(False) == 1
+
+
+def test_refresh_rejects_token_mirrored_as_revoked(
+    client, async_session_maker, monkeypatch
+):
+    _login_verified_user(client, async_session_maker, "mirrored@example.com")
+    checked = []
+
+    async def fake_is_revoked(token_hash: bytes) -> bool:
+        checked.append(token_hash)
+        return True
+
+    monkeypatch.setattr(auth_routes.token_revocation, "is_revoked", fake_is_revoked)
+    refresh_token = client.cookies["refresh_token"]
+
+    assert client.post("/auth/refresh").status_code == 401
+    assert checked == [security.generate_token_hash(refresh_token)]
+
+    user = _run(_get_user_by_email(async_session_maker, "mirrored@example.com"))
+    tokens = _run(_get_refresh_tokens(async_session_maker, user.id))
+    assert [token.revoked for token in tokens] == [False]
+
+
 def test_refresh_requires_cookie(client):
     response = client.post("/auth/refresh")
     assert response.status_code == 401
 
 
-def test_logout_revokes_and_clears_cookie(client, async_session_maker):
-    _register_user(client, email="logout@example.com")
-    login_response = _login_user(client, email="logout@example.com")
+def test_logout_revokes_and_clears_cookie(client, async_session_maker, monkeypatch):
+    mirrored = []
+
+    async def fake_mark_revoked(tokens):
+        mirrored.extend(token_hash for token_hash, _ in tokens)
+
+    monkeypatch.setattr(auth_routes.token_revocation, "mark_revoked", fake_mark_revoked)
+    login_response = _login_verified_user(
+        client, async_session_maker, "logout@example.com"
+    )
     access_token = login_response.json()["access_token"]
+    refresh_token = client.cookies["refresh_token"]
 
     logout_response = client.post(
         "/auth/logout", headers={"Authorization": f"Bearer {access_token}"}
     )
     assert logout_response.status_code == 200
 
+    assert mirrored == [security.generate_token_hash(refresh_token)]
+
+    _use_refresh_cookie(client, refresh_token)
     refresh_response = client.post("/auth/refresh")
     assert refresh_response.status_code == 401
 
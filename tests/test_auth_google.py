@@ -97,12 +97,21 @@ def test_google_callback_links_existing_user(client, async_session_maker, monkey
     monkeypatch.setattr(auth_routes, "_exchange_google_code", fake_exchange)
     monkeypatch.setattr(auth_routes, "_fetch_google_userinfo", fake_userinfo)
 
+    hashed = []
+
+    async def fake_hash(password: str):
+        hashed.append(password)
+        return "hashed"
+
+    monkeypatch.setattr(auth_routes, "get_password_hash_async", fake_hash)
+
     client.cookies.set("google_oauth_state", "state")
     client.cookies.set("google_oauth_verifier", "verifier")
     client.cookies.set("google_oauth_redirect", "/")
 
     response = client.get("/auth/google/callback?code=abc&state=state", follow_redirects=False)
     assert response.status_code == 302
+    assert hashed == []
 
     user = _run(_get_user_by_email(async_session_maker, "linked@example.com"))
     assert user is not None
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from app.services import email
+
+
+def test_template_read_failure_is_not_cached(monkeypatch):
+    email._read_template.cache_clear()
+    read_text = Path.read_text
+    calls = []
+
+    def flaky_read_text(self, *args, **kwargs):
+        calls.append(self.name)
+        if len(calls) == 1:
+            raise OSError("transient read failure")
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", flaky_read_text)
+
+    assert email._load_template("verification.txt") == ""
+    assert "{{verify_url}}" in email._load_template("verification.txt")
+    assert "{{verify_url}}" in email._load_template("verification.txt")
+    assert calls == ["verification.txt", "verification.txt"]
+    email._read_template.cache_clear()
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import bcrypt
+import jwt
+import pytest
+
+from app.core import security
+from app.core.config import settings
+
+
+def test_decode_token_cached_reuses_verified_payload(monkeypatch):
+    token = security.create_refresh_token(data={"sub": "cached@example.com"})
+    calls = []
+    decode_token = security.decode_token
+
+    def counting_decode(value: str):
+        calls.append(value)
+        return decode_token(value)
+
+    monkeypatch.setattr(security, "decode_token", counting_decode)
+
+    first = security.decode_token_cached(token)
+    second = security.decode_token_cached(token)
+
+    assert first == second
+    assert first["sub"] == "cached@example.com"
+    assert calls == [token]
+
+
+def test_decode_token_cached_does_not_cache_invalid_or_expired_tokens():
+    expired = security.create_access_token(
+        data={"sub": "expired@example.com"}, expires_delta=timedelta(seconds=-1)
+    )
+
+    for token in ("not-a-jwt", expired):
+        with pytest.raises(ValueError):
+            security.decode_token_cached(token)
+        assert token not in security._decode_cache
+
+
+def test_refresh_tokens_are_unique_within_the_same_second():
+    first = security.create_refresh_token(data={"sub": "rotate@example.com"})
+    second = security.create_refresh_token(data={"sub": "rotate@example.com"})
+
+    assert first != second
+
+
+def test_encode_token_matches_pyjwt():
+    payload = {"sub": "encode@example.com", "type": "access", "exp": 4102444800}
+
+    assert security.encode_token(payload) == jwt.encode(
+        payload, settings.jwt_secret_key, algorithm="HS256"
+    )
+
+
+def test_password_hash_uses_argon2id():
+    hashed = security.get_password_hash("s3cret-pass")
+
+    assert hashed.startswith("$argon2id$")
+    assert security.verify_password("s3cret-pass", hashed)
+    assert not security.verify_password("wrong-pass", hashed)
+    assert not security.password_needs_rehash(hashed)
+
+
+def test_legacy_bcrypt_hash_verifies_and_needs_rehash():
+    legacy = bcrypt.hashpw(b"s3cret-pass", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+    assert security.verify_password("s3cret-pass", legacy)
+    assert not security.verify_password("wrong-pass", legacy)
+    assert security.password_needs_rehash(legacy)
+
+
+def test_verify_password_rejects_malformed_hash():
+    assert not security.verify_password("anything", "not-a-hash")
+
+
+def test_eddsa_tokens_round_trip(monkeypatch):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+    private_pem = (
+        Ed25519PrivateKey.generate()
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode("ascii")
+    )
+    monkeypatch.setattr(settings, "jwt_secret_key", private_pem)
+    monkeypatch.setattr(settings, "jwt_algorithm", "EdDSA")
+
+    token = security.create_access_token(data={"sub": "eddsa@example.com"})
+
+    assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+    assert security.decode_token(token)["sub"] == "eddsa@example.com"
@@ -1,11 +1,16 @@
 import asyncio
+import base64
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime, timedelta
 
+from app import worker
 from app.api.deps import get_current_active_user
-from app.api.routes import tts as tts_routes
+from app.core.config import settings
 from app.main import app
 from app.models.tts_dataset import DatasetStatus, TranscriptType, TTSDataset
 from app.models.user import User
 from app.services import audio_processor, s3
+from app.worker import claim_next_dataset, process_claimed_dataset
 
 
 def _run(coro):
@@ -63,7 +68,6 @@ def test_create_dataset_auto_process_true(client, async_session_maker, monkeypat
 
     monkeypatch.setattr(s3, "upload_file", fake_upload)
     monkeypatch.setattr(audio_processor, "validate_audio_file", lambda data: (True, None))
-    monkeypatch.setattr(tts_routes, "_process_dataset_task", lambda *args, **kwargs: None)
 
     response = client.post(
         "/tts/datasets",
@@ -130,3 +134,372 @@ def test_process_dataset_invalid_status(client, async_session_maker):
 
     assert response.status_code == 400
     assert "Dataset cannot be processed" in response.json()["detail"]
+
+
+def test_list_datasets_paginates(client, async_session_maker):
+    user = _run(_create_user(async_session_maker, "paging@example.com"))
+    datasets = [_run(_create_dataset(async_session_maker, user.id)) for _ in range(3)]
+
+    async def spread_created_at():
+        async with async_session_maker() as session:
+            for age, dataset in enumerate(datasets):
+                stored = await session.get(TTSDataset, dataset.id)
+                stored.created_at = datetime(2026, 1, 1, tzinfo=UTC) - timedelta(
+                    minutes=age
+                )
+            await session.commit()
+
+    _run(spread_created_at())
+    _override_current_user(user)
+
+    first_page = client.get("/tts/datasets", params={"limit": 2})
+    cursor = first_page.headers["x-next-cursor"]
+    second_page = client.get("/tts/datasets", params={"limit": 2, "cursor": cursor})
+    bad_cursor = client.get("/tts/datasets", params={"cursor": "not-a-cursor"})
+    aware_cursor = base64.urlsafe_b64encode(
+        f"2026-01-01T00:00:00+00:00|{datasets[0].id}".encode()
+    ).decode("ascii")
+    offset_cursor = client.get("/tts/datasets", params={"cursor": aware_cursor})
+
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    assert len(second_page.json()) == 1
+    assert "x-next-cursor" not in second_page.headers
+    first_ids = {item["id"] for item in first_page.json()}
+    assert second_page.json()[0]["id"] not in first_ids
+    assert bad_cursor.status_code == 400
+    assert offset_cursor.status_code == 400
+
+
+def test_worker_claims_queued_dataset_once(async_session_maker):
+    user = _run(_create_user(async_session_maker, "worker@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+
+    async def claim():
+        async with async_session_maker() as session:
+            return await claim_next_dataset(session)
+
+    # Drain the queue; other tests may have left datasets in it.
+    claimed_ids = []
+    while (claimed := _run(claim())) is not None:
+        assert claimed.processing_started_at is not None
+        claimed_ids.append(claimed.id)
+
+    assert claimed_ids.count(dataset.id) == 1
+
+
+def test_create_dataset_cleans_up_after_failed_upload(
+    client, async_session_maker, monkeypatch
+):
+    user = _run(_create_user(async_session_maker, "upload-fail@example.com"))
+    _override_current_user(user)
+
+    deleted = []
+
+    def fake_upload(key: str, data, content_type: str = "application/octet-stream"):
+        if "transcript" in key:
+            raise RuntimeError("transcript upload failed")
+
+    monkeypatch.setattr(s3, "upload_file", fake_upload)
+    monkeypatch.setattr(s3, "delete_files", deleted.extend)
+    monkeypatch.setattr(
+        audio_processor, "validate_audio_file", lambda data: (True, None)
+    )
+
+    response = client.post(
+        "/tts/datasets",
+        data={"name": "Broken upload", "transcript_type": "text"},
+        files={
+            "audio": ("sample.wav", b"fake-audio", "audio/wav"),
+            "transcript": ("transcript.txt", b"hello world", "text/plain"),
+        },
+    )
+
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert response.status_code == 500
+    assert "transcript upload failed" in response.json()["detail"]
+    assert any("source_audio" in key for key in deleted)
+    assert any("transcript" in key for key in deleted)
+
+
+def test_worker_reclaims_abandoned_dataset(async_session_maker):
+    user = _run(_create_user(async_session_maker, "abandoned@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+
+    async def abandon():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            stored.processing_started_at = datetime.now(UTC) - timedelta(days=1)
+            await session.commit()
+
+    async def claim():
+        async with async_session_maker() as session:
+            return await claim_next_dataset(session)
+
+    _run(abandon())
+    claimed_ids = []
+    while (claimed := _run(claim())) is not None:
+        claimed_ids.append(claimed.id)
+
+    assert dataset.id in claimed_ids
+
+
+def test_delete_dataset_only_deletes_own_dataset(client, async_session_maker):
+    owner = _run(_create_user(async_session_maker, "owner@example.com"))
+    other = _run(_create_user(async_session_maker, "other@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, owner.id))
+
+    _override_current_user(other)
+    forbidden = client.delete(f"/tts/datasets/{dataset.id}")
+    _override_current_user(owner)
+    deleted = client.delete(f"/tts/datasets/{dataset.id}")
+    missing = client.delete(f"/tts/datasets/{dataset.id}")
+
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert forbidden.status_code == 404
+    assert deleted.status_code == 204
+    assert missing.status_code == 404
+
+
+def test_process_dataset_requeues_failed_dataset(client, async_session_maker):
+    user = _run(_create_user(async_session_maker, "requeue@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+
+    async def fail():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            stored.status = DatasetStatus.FAILED.value
+            stored.error_message = "boom"
+            await session.commit()
+
+    _run(fail())
+    _override_current_user(user)
+
+    response = client.post(f"/tts/datasets/{dataset.id}/process")
+
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == DatasetStatus.PROCESSING.value
+    assert data["error_message"] is None
+
+
+def test_direct_upload_presigns_then_confirms(client, async_session_maker, monkeypatch):
+    user = _run(_create_user(async_session_maker, "presign@example.com"))
+    _override_current_user(user)
+
+    def fake_presign(key, content_type, max_bytes, expiration=600):
+        return {"url": "https://bucket.s3.amazonaws.com/", "fields": {"key": key}}
+
+    uploaded = set()
+    monkeypatch.setattr(s3, "generate_presigned_post", fake_presign)
+    monkeypatch.setattr(
+        s3,
+        "head_file",
+        lambda key: {"ContentLength": 1024} if key in uploaded else None,
+    )
+
+    presign = client.post(
+        "/tts/datasets/uploads",
+        json={"transcript_type": "srt", "audio_extension": "mp3"},
+    )
+    assert presign.status_code == 200
+    body = presign.json()
+    audio_key = body["audio"]["s3_key"]
+    transcript_key = body["transcript"]["s3_key"]
+    assert audio_key.startswith(f"users/{user.id}/datasets/{body['dataset_id']}/")
+    assert audio_key.endswith("source_audio.mp3")
+    assert transcript_key.endswith("transcript.srt")
+    assert body["audio"]["fields"] == {"key": audio_key}
+
+    confirm = {
+        "dataset_id": body["dataset_id"],
+        "name": "Direct upload",
+        "transcript_type": "srt",
+        "audio_extension": "mp3",
+    }
+    missing = client.post("/tts/datasets/confirm", json=confirm)
+    assert missing.status_code == 400
+
+    uploaded.update((audio_key, transcript_key))
+    created = client.post("/tts/datasets/confirm", json=confirm)
+    duplicate = client.post("/tts/datasets/confirm", json=confirm)
+
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert created.status_code == 201
+    assert created.json()["id"] == body["dataset_id"]
+    assert created.json()["audio_s3_key"] == audio_key
+    assert created.json()["status"] == DatasetStatus.PROCESSING.value
+    assert duplicate.status_code == 409
+
+
+def test_worker_drops_result_for_dataset_deleted_while_processing(
+    async_session_maker, monkeypatch
+):
+    user = _run(_create_user(async_session_maker, "deleted-mid-run@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+
+    async def delete_then_finish(**kwargs):
+        async with async_session_maker() as other:
+            await other.delete(await other.get(TTSDataset, kwargs["dataset_id"]))
+            await other.commit()
+        return audio_processor.ProcessingResult(
+            segments=[],
+            total_duration_seconds=1.0,
+            training_data_jsonl=b"",
+            segment_s3_keys=[],
+            training_data_s3_key="training_data.jsonl.gz",
+        )
+
+    monkeypatch.setattr(audio_processor, "process_dataset", delete_then_finish)
+
+    async def process():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            await process_claimed_dataset(session, stored)
+        async with async_session_maker() as session:
+            return await session.get(TTSDataset, dataset.id)
+
+    assert _run(process()) is None
+
+
+def test_worker_marks_dataset_failed_when_processing_raises(
+    async_session_maker, monkeypatch
+):
+    user = _run(_create_user(async_session_maker, "raises@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+
+    async def explode(**kwargs):
+        raise RuntimeError("decoder crashed")
+
+    monkeypatch.setattr(audio_processor, "process_dataset", explode)
+
+    async def process():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            await process_claimed_dataset(session, stored)
+        async with async_session_maker() as session:
+            return await session.get(TTSDataset, dataset.id)
+
+    stored = _run(process())
+    assert stored.status == DatasetStatus.FAILED.value
+    assert stored.error_message == "decoder crashed"
+
+
+def test_worker_loop_survives_transient_errors(async_session_maker, monkeypatch):
+    calls = []
+    stop = asyncio.Event()
+
+    async def flaky_claim(db):
+        calls.append(None)
+        if len(calls) == 1:
+            raise ConnectionError("database went away")
+        stop.set()
+        return None
+
+    monkeypatch.setattr(worker, "async_session", async_session_maker)
+    monkeypatch.setattr(worker, "claim_next_dataset", flaky_claim)
+    monkeypatch.setattr(settings, "dataset_worker_poll_seconds", 0.01)
+    monkeypatch.setattr(settings, "dataset_worker_concurrency", 2)
+
+    _run(worker.run_worker(stop))
+
+    assert len(calls) >= 2
+
+
+def _ready_result(**kwargs):
+    return audio_processor.ProcessingResult(
+        segments=[],
+        total_duration_seconds=1.0,
+        training_data_jsonl=b"",
+        segment_s3_keys=[],
+        training_data_s3_key="training_data.jsonl.gz",
+    )
+
+
+async def _claim_dataset(async_session_maker, dataset_id):
+    async with async_session_maker() as session:
+        stored = await session.get(TTSDataset, dataset_id)
+        stored.processing_started_at = datetime.now(UTC)
+        await session.commit()
+
+
+def test_worker_drops_result_after_dataset_is_reclaimed(
+    async_session_maker, monkeypatch
+):
+    user = _run(_create_user(async_session_maker, "reclaimed@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+    _run(_claim_dataset(async_session_maker, dataset.id))
+
+    async def reclaimed_then_finish(**kwargs):
+        # Another worker takes the dataset over while this one is still busy.
+        await _claim_dataset(async_session_maker, kwargs["dataset_id"])
+        return _ready_result()
+
+    monkeypatch.setattr(audio_processor, "process_dataset", reclaimed_then_finish)
+
+    async def process():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            await process_claimed_dataset(session, stored)
+        async with async_session_maker() as session:
+            return await session.get(TTSDataset, dataset.id)
+
+    assert _run(process()).status == DatasetStatus.PROCESSING.value
+
+
+def test_worker_renews_claim_during_long_processing(async_session_maker, monkeypatch):
+    user = _run(_create_user(async_session_maker, "long-run@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+    _run(_claim_dataset(async_session_maker, dataset.id))
+
+    async def slow(**kwargs):
+        await asyncio.sleep(0.8)
+        return _ready_result()
+
+    monkeypatch.setattr(worker, "async_session", async_session_maker)
+    monkeypatch.setattr(settings, "dataset_worker_claim_timeout_seconds", 1)
+    monkeypatch.setattr(audio_processor, "process_dataset", slow)
+
+    async def process():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            claimed_at = stored.processing_started_at
+            await process_claimed_dataset(session, stored)
+        async with async_session_maker() as session:
+            return claimed_at, await session.get(TTSDataset, dataset.id)
+
+    claimed_at, stored = _run(process())
+    assert stored.processing_started_at > claimed_at
+    assert stored.status == DatasetStatus.READY.value
+
+
+def test_worker_requeues_dataset_when_processing_pool_breaks(
+    async_session_maker, monkeypatch
+):
+    user = _run(_create_user(async_session_maker, "broken-pool@example.com"))
+    dataset = _run(_create_dataset(async_session_maker, user.id))
+    _run(_claim_dataset(async_session_maker, dataset.id))
+
+    async def child_killed(**kwargs):
+        raise BrokenProcessPool("child process terminated abruptly")
+
+    monkeypatch.setattr(audio_processor, "process_dataset", child_killed)
+
+    async def process():
+        async with async_session_maker() as session:
+            stored = await session.get(TTSDataset, dataset.id)
+            await process_claimed_dataset(session, stored)
+        async with async_session_maker() as session:
+            return await session.get(TTSDataset, dataset.id)
+
+    stored = _run(process())
+    assert stored.status == DatasetStatus.PROCESSING.value
+    assert stored.processing_started_at is None
+    assert stored.error_message is None